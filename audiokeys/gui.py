@@ -7,13 +7,18 @@ audiokeys — PySide 6
 from __future__ import annotations
 
 import json
+import os
+import re
 import sys
 import threading
+import time
+from functools import partial
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 
 import numpy as np
 from q_materialise import inject_style
+from scipy.signal import sosfilt, sosfilt_zi
 from appdirs import user_data_dir
 
 # ``sounddevice`` is used to enumerate audio capture devices and open
@@ -29,6 +34,13 @@ try:
 except ImportError:
     sd = None
 
+# ``orjson`` is an optional speed-up for persisting the mapping tables; the
+# stored text is plain JSON either way, so the stdlib is a drop-in fallback.
+try:
+    import orjson  # type: ignore
+except ImportError:
+    orjson = None
+
 # ─── Qt ────────────────────────────────────────────────────────────────────────
 from PySide6 import QtCore, QtGui, QtWidgets
 from PySide6.QtCore import QPoint, QSettings
@@ -71,21 +83,23 @@ between launches without editing the ``constants.py`` file.
 # ``pip install -e .``.
 try:
     from audiokeys import constants  # type: ignore
-    from audiokeys.sound_worker import SoundWorker  # type: ignore
+    from audiokeys.sound_worker import SoundWorker, highpass_sos  # type: ignore
 
     # ``record_until_silence`` is no longer used directly; recording logic lives
     # in ``RecordingThread``.
     from audiokeys.utils import make_svg_toolbutton, resource_path  # type: ignore
-    from audiokeys.noise_gate import calculate_noise_floor, trim_silence  # type: ignore
+    from audiokeys.noise_gate import trim_silence  # type: ignore
+    from audiokeys.sample_cache import load_sample_file, write_sample_cache  # type: ignore
 except Exception:
     # Local fallback imports – only works when run from the project root
     import constants  # type: ignore
-    from sound_worker import SoundWorker  # type: ignore
+    from sound_worker import SoundWorker, highpass_sos  # type: ignore
 
     # ``record_until_silence`` is no longer used directly; recording logic lives
     # in ``RecordingThread``.
     from utils import resource_path  # type: ignore
-    from noise_gate import calculate_noise_floor, trim_silence  # type: ignore
+    from noise_gate import trim_silence  # type: ignore
+    from sample_cache import load_sample_file, write_sample_cache  # type: ignore
 
 # ─── Note ──────────────────────────────────────────────────────────────────
 # The audio capture and key mapping features are designed to work cross‑platform.
@@ -101,6 +115,167 @@ except Exception:
 # separate module avoids duplication and makes it easy to tune the system from
 # one place.
 
+# Alternative spellings of special keys, mapped to the name offered in
+# ``KeySelectDialog``.  ``KeySender`` treats each pair as the same key.
+_KEY_ALIASES: dict[str, str] = {"return": "enter", "escape": "esc"}
+
+# Keys offered by ``KeySelectDialog``: letters, digits, special names and
+# function keys.  The list never changes so it is built once at import time
+# rather than on every dialogue open.
+_KEY_CHOICES: tuple[str, ...] = tuple(
+    sorted(
+        dict.fromkeys(
+            [chr(c) for c in range(ord("a"), ord("z") + 1)]
+            + [str(d) for d in range(10)]
+            + [
+                "space",
+                "enter",
+                "tab",
+                "esc",
+                "left",
+                "right",
+                "up",
+                "down",
+                "home",
+                "end",
+                "pageup",
+                "pagedown",
+                "backspace",
+                "delete",
+                "capslock",
+            ]
+            + [f"f{i}" for i in range(1, 13)]
+        )
+    )
+)
+# Combo-box row of each key so the current mapping can be preselected
+# without a linear ``findText`` scan.
+_KEY_INDEX: dict[str, int] = {k: i for i, k in enumerate(_KEY_CHOICES)}
+# Item model shared by every ``KeySelectDialog`` combo box; created on first
+# use because Qt models need a running application.
+_key_choice_model: Optional[QtCore.QStringListModel] = None
+
+
+def _key_choices_model() -> QtCore.QStringListModel:
+    """Return the shared item model listing :data:`_KEY_CHOICES`."""
+    global _key_choice_model
+    if _key_choice_model is None:
+        _key_choice_model = QtCore.QStringListModel(
+            list(_KEY_CHOICES), QtWidgets.QApplication.instance()
+        )
+    return _key_choice_model
+
+
+# Seconds a PortAudio device enumeration is reused before re-querying.
+_DEVICE_CACHE_TTL: float = 5.0
+
+# Most log lines held between flushes; older lines in a burst are dropped.
+_LOG_BUFFER_MAX: int = 200
+
+# Lines kept in the output log widget; the oldest are discarded beyond this.
+_LOG_MAX_LINES: int = 2000
+
+# ``(icon, tooltip, MainWindow method)`` for the buttons on each mapping row;
+# every method takes the row's sample id.
+_ROW_ACTIONS: tuple[tuple[str, str, str], ...] = (
+    ("assets/keyboard.svg", "Change Key", "_change_key"),
+    ("assets/edit.svg", "Edit Samples", "_edit_samples"),
+    ("assets/delete.svg", "Delete Mapping", "_delete_mapping"),
+)
+
+# Style and duration (ms) of the flash on a mapping row when its key fires.
+_HIGHLIGHT_QSS = "background-color: yellow"
+_HIGHLIGHT_MS: int = 300
+
+# Milliseconds of quiet after the last mapping edit before staged settings
+# are written to ``QSettings``; see ``MainWindow._queue_setting``.
+_SETTINGS_FLUSH_MS: int = 200
+
+# PortAudio devices that merely mirror an output (PulseAudio monitors,
+# WASAPI loopbacks) rather than capture from a microphone.
+_MONITOR_RE = re.compile(r"monitor|loopback", re.IGNORECASE)
+
+# Sample matching algorithms offered by ``SettingsDialog`` and their
+# combo-box rows.
+_METHODS: tuple[str, ...] = ("waveform", "mfcc", "dtw")
+_METHOD_INDEX: dict[str, int] = {m: i for i, m in enumerate(_METHODS)}
+
+# Project documentation opened by Help → Visit Docs; update if you fork.
+_DOCS_URL = QtCore.QUrl("https://github.com/lewis-morris/audiokeys")
+
+# Body of the Help → About dialogue.
+_ABOUT_HTML = (
+    "<h3>AudioKeys</h3>"
+    "<p>Turn sound into action. Record distinctive audio samples and map them to key presses — "
+    "control your computer using just your voice or custom noises.</p>"
+    "<p>Built by Lewis Morris (Arched.dev), this project is fully open source.</p>"
+    "<p>Explore the code, report issues or contribute on "
+    "<a href='https://github.com/lewis-morris/audiokeys'>GitHub</a>. "
+    "Distributed under the MIT License.</p>"
+)
+
+
+# Audio parameters editable in ``SettingsDialog`` with their defaults; the
+# default's type is also the type each stored value is read back as.
+_AUDIO_SETTING_DEFAULTS: dict[str, Any] = {
+    "sample_rate": constants.SAMPLE_RATE,
+    "buffer_size": constants.BUFFER_SIZE,
+    "hop_size": constants.HOP_SIZE,
+    "hp_cutoff": constants.HP_FILTER_CUTOFF,
+    "noise_gate_margin": constants.NOISE_GATE_MARGIN,
+    "match_threshold": constants.MATCH_THRESHOLD,
+    "detection_method": constants.MATCH_METHOD,
+}
+
+
+def _read_audio_settings(settings: Optional[QSettings]) -> dict[str, Any]:
+    """Return every audio parameter as a typed value in one pass.
+
+    Missing keys, or a missing ``settings`` object, fall back to the
+    defaults from :mod:`constants`.
+    """
+    if settings is None:
+        return dict(_AUDIO_SETTING_DEFAULTS)
+    return {
+        key: settings.value(key, default, type=type(default))
+        for key, default in _AUDIO_SETTING_DEFAULTS.items()
+    }
+
+
+def _read_noise_floor(settings: Optional[QSettings], device: int) -> Optional[float]:
+    """Return the calibrated noise floor stored for ``device``, if any."""
+    if settings is None:
+        return None
+    value = settings.value(f"noise_floor_{device}", None)
+    try:
+        return float(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+def _json_dumps(obj: object) -> str:
+    """Serialise ``obj`` to JSON text, using ``orjson`` when available."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj)
+
+
+def _json_loads(text: str) -> Any:
+    """Parse JSON ``text``, using ``orjson`` when available."""
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+def _is_monitor(name: str) -> bool:
+    """Return ``True`` if a device name marks a monitor or loopback source."""
+    return _MONITOR_RE.search(name) is not None
+
+
+def _rms_to_level(rms: float) -> int:
+    """Convert an RMS amplitude (typically 0–1) into a 0–100 meter level."""
+    return 100 if rms >= 1 / 3 else int(rms * 300.0)
+
 
 class KeyMappingWindow(QtWidgets.QDialog):
     """Separate window showing all key mappings in a scrollable list."""
@@ -139,25 +314,48 @@ class KeyMappingWindow(QtWidgets.QDialog):
         btn_box.addWidget(close_btn)
         layout.addLayout(btn_box)
 
+        # sample_id → (key_name, row widget) for rows currently shown
+        self._rows: dict[str, tuple[str, QtWidgets.QWidget]] = {}
+        # main_window._mapping_revision the rows were last built from
+        self._seen_revision = -1
         self.refresh()
 
         self.setMinimumWidth(700)
         self.setMinimumHeight(800)  # constrain height
 
     def refresh(self):
-        # Clear existing rows
+        revision = self.main_window._mapping_revision
+        if revision == self._seen_revision:
+            return
+        self._seen_revision = revision
+        note_map = self.main_window.note_map
+        # Suspend painting and layout so the rebuild costs one relayout
+        self.inner.setUpdatesEnabled(False)
+        self.inner_layout.setEnabled(False)
+
+        # Detach all rows; those still current are re-added below
         while self.inner_layout.count():
-            item = self.inner_layout.takeAt(0)
-            w = item.widget()
-            if w:
-                w.setParent(None)
-
-        # Rebuild from the authoritative main_window.note_map
-        for sample_id, key_name in self.main_window.note_map.items():
-            row = self.main_window._make_mapping_row_widget(sample_id, key_name)
+            self.inner_layout.takeAt(0)
+        for sample_id, (key_name, row) in list(self._rows.items()):
+            if note_map.get(sample_id) != key_name:
+                del self._rows[sample_id]
+                row.setParent(None)
+
+        # Rebuild from the authoritative main_window.note_map, reusing rows
+        # whose sample and key are unchanged
+        for sample_id, key_name in note_map.items():
+            entry = self._rows.get(sample_id)
+            if entry is None:
+                row = self.main_window._make_mapping_row_widget(sample_id, key_name)
+                self._rows[sample_id] = (key_name, row)
+            else:
+                row = entry[1]
             self.inner_layout.addWidget(row)
         self.inner_layout.addStretch()
 
+        self.inner_layout.setEnabled(True)
+        self.inner.setUpdatesEnabled(True)
+
     def _on_add(self):
         self.main_window._add_mapping()
         self.refresh()
@@ -178,6 +376,14 @@ class MainWindow(QtWidgets.QMainWindow):
         # 2️⃣ mappings and persistent storage
         # ``note_map`` stores sample identifiers → key names
         self.note_map: dict[str, str] = {}
+        # reverse index of ``note_map`` (key name → sample identifier) so
+        # "key already in use" checks don't scan every mapping
+        self._key_to_sample: dict[str, str] = {}
+        # bumped on every ``note_map`` change so views can skip rebuilds
+        self._mapping_revision = 0
+        # state last handed to ``QSettings``, so no-op saves can be skipped
+        self._saved_note_map_revision = -1
+        self._saved_sample_files_hash: Optional[int] = None
         # recorded samples keyed by identifier; each entry stores a list of
         # reference samples for that sound
         self.samples: dict[str, list[np.ndarray]] = {}
@@ -188,41 +394,149 @@ class MainWindow(QtWidgets.QMainWindow):
         self.data_dir.mkdir(parents=True, exist_ok=True)
 
         self.worker: Optional[SoundWorker] = None
+        # True from a successful start until stop or the worker finishing,
+        # so toggles need not ask the thread whether it is still running.
+        self._running = False
+        self.keymapping_window: Optional[KeyMappingWindow] = None
+        # ``(devices, hostapis)`` from PortAudio; see ``_device_snapshot``
+        self._device_cache: Optional[tuple[list[dict], list[dict]]] = None
+        self._device_cache_ts = 0.0
+        # Start-up enumeration running off the GUI thread, if any.
+        self._device_enum: Optional[DeviceEnumWorker] = None
+        # Index of the checked Audio Input action, kept in step with the
+        # menu so ``current_device_index`` need not scan its actions.
+        self._checked_device_idx: Optional[int] = None
+        # The Audio Input menu is filled on first use rather than at startup
+        # and refilled after the device list has been invalidated.
+        self._device_menu_dirty = True
+        self._settings_dlg: Optional[SettingsDialog] = None
+        # Typed audio parameters from ``_read_audio_settings``; the settings
+        # dialogue, their only writer, updates it alongside ``QSettings``.
+        self._audio_settings: Optional[dict[str, Any]] = None
 
         # Track test mode (True disables key presses).  Persist value in settings.
-        tm_val = self.settings.value("test_mode", False)
-        # QSettings may return strings; normalise to bool
-        if isinstance(tm_val, str):
-            self.test_mode = tm_val.lower() in ("true", "1", "yes", "y")
-        else:
-            self.test_mode = bool(tm_val)
+        # ``type=bool`` has Qt convert INI strings such as "true"/"false".
+        self.test_mode = self.settings.value("test_mode", False, type=bool)
 
         # store labels for each note mapping so we can update them easily
         self.key_labels: dict[str, QtWidgets.QLineEdit] = {}
         # widgets representing each mapping for grid layout
         self.mapping_widgets: dict[str, QtWidgets.QWidget] = {}
+        # one single-shot timer per key label that clears its highlight
+        self._highlight_timers: dict[str, QtCore.QTimer] = {}
+        # last value pushed to the level bar; used to skip redundant repaints
+        self._last_level = 0
+        # The meter polls the worker's latest RMS at ~30 Hz instead of
+        # repainting for every audio hop.
+        self._amp_timer = QtCore.QTimer(self)
+        self._amp_timer.setInterval(33)
+        self._amp_timer.timeout.connect(self._on_amplitude_changed)
+        # Log lines are buffered and written in one batch shortly after the
+        # first arrives so bursts of detections cost a single relayout.
+        self._log_buf: list[str] = []
+        self._log_timer = QtCore.QTimer(self)
+        self._log_timer.setSingleShot(True)
+        self._log_timer.setInterval(80)
+        self._log_timer.timeout.connect(self._flush_log)
+        # Mapping edits are staged here and written to ``QSettings`` in one
+        # batch once edits pause; see ``_queue_setting``.
+        self._pending_settings: dict[str, object] = {}
+        self._settings_timer = QtCore.QTimer(self)
+        self._settings_timer.setSingleShot(True)
+        self._settings_timer.setInterval(_SETTINGS_FLUSH_MS)
+        self._settings_timer.timeout.connect(self._flush_settings)
+        # Sample caches are written off the UI thread one at a time, so
+        # successive saves of the same mapping land in order.
+        self._save_pool = QtCore.QThreadPool(self)
+        self._save_pool.setMaxThreadCount(1)
+        # Cache writes not yet known to be finished, per mapping
+        self._cache_jobs: dict[str, list[SampleCacheJob]] = {}
 
         # Build the user interface
         self._build_ui()
 
-        # Load any previously recorded samples
-        self._load_samples()
+        # Previously recorded samples are loaded from the first ``showEvent``,
+        # after the window has been painted; see :meth:`showEvent`
+        self._samples_requested = False
 
         # Build menu bar with file, settings and help entries
         self._create_menu()
 
+        # Enumerate audio devices on a worker thread while the window comes
+        # up, so the first menu open or device lookup finds them cached.
+        if sd is not None:
+            self._device_enum = DeviceEnumWorker(self)
+            self._device_enum.devicesReady.connect(self._apply_device_list)
+            self._device_enum.finished.connect(self._on_device_enum_finished)
+            self._device_enum.start()
+
     def _save_mappings(self) -> None:
         """Persist sample metadata to ``QSettings``."""
-        self.settings.setValue("note_map", json.dumps(self.note_map))
-        self.settings.setValue("sample_files", json.dumps(self.sample_files))
+        self._save_note_map()
+        self._save_sample_files()
+
+    def _save_note_map(self) -> None:
+        """Persist the sample → key table to ``QSettings`` if it changed."""
+        if self._mapping_revision == self._saved_note_map_revision:
+            return
+        self._saved_note_map_revision = self._mapping_revision
+        self._queue_setting("note_map", _json_dumps(self.note_map))
+
+    def _save_sample_files(self) -> None:
+        """Persist the sample → file paths table to ``QSettings`` if it changed."""
+        digest = hash(tuple((k, tuple(v)) for k, v in self.sample_files.items()))
+        if digest == self._saved_sample_files_hash:
+            return
+        self._saved_sample_files_hash = digest
+        self._queue_setting("sample_files", _json_dumps(self.sample_files))
+
+    def _queue_setting(self, key: str, value: object) -> None:
+        """Stage ``key`` for writing; the latest value wins.
+
+        Each call restarts the debounce timer, so a burst of edits reaches
+        ``QSettings`` as a single batch of writes and one sync.
+        """
+        self._pending_settings[key] = value
+        self._settings_timer.start()
+
+    def _flush_settings(self) -> None:
+        """Write all staged settings and sync them to storage."""
+        self._settings_timer.stop()
+        if not self._pending_settings:
+            return
+        for key, value in self._pending_settings.items():
+            self.settings.setValue(key, value)
+        self._pending_settings.clear()
+        self.settings.sync()
+
+    def _write_sample_cache(self, sample_id: str) -> str:
+        """Queue the samples of ``sample_id`` to be packed into one ``.npz``.
+
+        The samples are already trimmed when recorded.  They are quantised
+        to 16-bit PCM, which is lossy but half the size of float32.  The
+        write runs on ``_save_pool`` so the UI is not blocked on disk I/O;
+        failures are reported in the output log.  Returns the path of the
+        cache.
+        """
+        path = self.data_dir / f"{sample_id}.npz"
+        job = SampleCacheJob(path, list(self.samples[sample_id]))
+        job.signals.failed.connect(self._on_sample_cache_failed)
+        jobs = self._cache_jobs.setdefault(sample_id, [])
+        jobs[:] = [j for j in jobs if not j.done]
+        jobs.append(job)
+        self._save_pool.start(job)
+        return str(path)
+
+    def _on_sample_cache_failed(self, path: str, error: str) -> None:
+        self._append_log(f"Failed to save samples to {path}: {error}")
 
     def _load_samples(self) -> None:
         """Load previously recorded samples from disk, pruning missing or invalid ones."""
         map_json = self.settings.value("note_map", "{}")
         files_json = self.settings.value("sample_files", "{}")
         try:
-            raw_note_map = json.loads(map_json)
-            raw_sample_files = json.loads(files_json)
+            raw_note_map = _json_loads(map_json)
+            raw_sample_files = _json_loads(files_json)
         except Exception:
             raw_note_map = {}
             raw_sample_files = {}
@@ -230,38 +544,51 @@ class MainWindow(QtWidgets.QMainWindow):
         cleaned_note_map: dict[str, str] = {}
         cleaned_sample_files: dict[str, list[str]] = {}
 
+        # One directory listing answers "does this file still exist?" for
+        # everything stored under ``data_dir``; other paths are stat'ed.
+        with os.scandir(self.data_dir) as entries:
+            existing = {e.name for e in entries if e.is_file()}
+
         for sample_id, paths in raw_sample_files.items():
             loaded: list[np.ndarray] = []
             valid_paths: list[str] = []
             for path in paths:
                 p = Path(path)
-                if not p.exists():
+                if p.parent == self.data_dir:
+                    present = p.name in existing
+                else:
+                    present = p.exists()
+                if not present:
                     # file was deleted manually; skip it
                     continue
                 try:
-                    sample = np.load(p)
+                    refs = load_sample_file(p)
                 except Exception as e:
-                    # log corrupted / unreadable file and skip it
+                    # log corrupted / unreadable / stale file and skip it
                     self._append_log(f"Failed to load sample {p!s}: {e}")
                     continue
-                trimmed = trim_silence(sample)
-                if trimmed.size:
-                    loaded.append(trimmed)
+                refs = [r for r in refs if r.size]
+                if refs:
+                    loaded.extend(refs)
                     valid_paths.append(str(p))
             if loaded:
                 # retain this mapping
                 self.samples[sample_id] = loaded
                 key = raw_note_map.get(sample_id, "")
+                # saved under an alias by older versions; store one spelling
+                key = _KEY_ALIASES.get(key, key)
                 self._add_mapping_row(sample_id, key)
                 cleaned_sample_files[sample_id] = valid_paths
                 if sample_id in raw_note_map:
-                    cleaned_note_map[sample_id] = raw_note_map[sample_id]
+                    cleaned_note_map[sample_id] = key
             else:
                 # no valid samples left; drop mapping and per-note setting
                 self.settings.remove(sample_id)
 
         # Replace with cleaned versions and persist
         self.note_map = cleaned_note_map
+        self._key_to_sample = {k: s for s, k in cleaned_note_map.items() if k}
+        self._mapping_revision += 1
         self.sample_files = cleaned_sample_files
         self._save_mappings()
 
@@ -277,6 +604,64 @@ class MainWindow(QtWidgets.QMainWindow):
     def _on_source_changed(self):
         self._populate_devices()
 
+    def _device_snapshot(self) -> tuple[list[dict], list[dict]]:
+        """Return the cached ``(devices, hostapis)`` lists from PortAudio.
+
+        Enumeration is a PortAudio round-trip, so the result is reused for
+        ``_DEVICE_CACHE_TTL`` seconds or until
+        :meth:`_invalidate_device_snapshot` is called.  Opening the Audio
+        Input menu after the TTL rebuilds it, so hot-plugged devices show up
+        then.  Failures propagate to the caller and are not cached.
+        """
+        enum = self._device_enum
+        if enum is not None:
+            # Needed before the start-up enumeration has been delivered:
+            # wait for it rather than query PortAudio a second time.
+            enum.wait()
+            if enum.result is not None and self._device_cache is None:
+                self._apply_device_list(*enum.result)
+        now = time.monotonic()
+        if (
+            self._device_cache is None
+            or now - self._device_cache_ts >= _DEVICE_CACHE_TTL
+        ):
+            self._device_cache = (
+                list(sd.query_devices()),
+                list(sd.query_hostapis()),
+            )
+            self._device_cache_ts = now
+        return self._device_cache
+
+    def _apply_device_list(self, devices: list, hostapis: list) -> None:
+        """Cache an enumeration from :class:`DeviceEnumWorker` and rebuild
+        the device lists from it."""
+        self._device_cache = (devices, hostapis)
+        self._device_cache_ts = time.monotonic()
+        self._device_menu_dirty = True
+        if self.audio_input_menu.isVisible():
+            # replace the "Refreshing…" placeholder in the open menu
+            self._fill_audio_input_menu()
+        self._populate_devices()
+
+    def _on_device_enum_finished(self) -> None:
+        self._device_enum = None
+
+    def _audio_config(self) -> dict[str, Any]:
+        """Return the typed audio parameters, reading ``QSettings`` once."""
+        if self._audio_settings is None:
+            self._audio_settings = _read_audio_settings(self.settings)
+        return self._audio_settings
+
+    def _invalidate_device_snapshot(self) -> None:
+        """Forget the cached device list so the next lookup re-queries."""
+        self._device_cache = None
+        self._device_menu_dirty = True
+
+    def _refresh_devices(self) -> None:
+        """Re-enumerate audio devices; menus rebuild when next shown."""
+        self._invalidate_device_snapshot()
+        self._populate_devices()
+
     # -----------------------------------------------------------------
     def _build_ui(self):
         central = QtWidgets.QWidget()
@@ -293,6 +678,7 @@ class MainWindow(QtWidgets.QMainWindow):
         self.log = QtWidgets.QPlainTextEdit()
         self.log.setReadOnly(True)
         self.log.setLineWrapMode(QtWidgets.QPlainTextEdit.NoWrap)
+        self.log.setMaximumBlockCount(_LOG_MAX_LINES)
         root_layout.addWidget(self.log, 1)
 
         # 5️⃣ Sound meter and tuner
@@ -342,11 +728,10 @@ class MainWindow(QtWidgets.QMainWindow):
         root_layout.addLayout(ctrl_layout)
 
         self.setCentralWidget(central)
-        self.resize(700, 800)
         self.setFixedSize(700, 800)
 
     def _open_keymapping_window(self):
-        if not getattr(self, "keymapping_window", None):
+        if self.keymapping_window is None:
             self.keymapping_window = KeyMappingWindow(self)
         self.keymapping_window.refresh()
         self.keymapping_window.exec()
@@ -446,19 +831,36 @@ class MainWindow(QtWidgets.QMainWindow):
             self._update_device_menu()
 
     # -----------------------------------------------------------------
+    def _bind_key(self, sample_id: str, key_name: str) -> None:
+        """Map ``sample_id`` to ``key_name`` and update the reverse index."""
+        old = self.note_map.get(sample_id)
+        if old is not None and self._key_to_sample.get(old) == sample_id:
+            del self._key_to_sample[old]
+        self.note_map[sample_id] = key_name
+        if key_name:
+            self._key_to_sample[key_name] = sample_id
+        self._mapping_revision += 1
+
+    def _unbind_key(self, sample_id: str) -> None:
+        """Remove ``sample_id`` from ``note_map`` and the reverse index."""
+        old = self.note_map.pop(sample_id, None)
+        if old is not None and self._key_to_sample.get(old) == sample_id:
+            del self._key_to_sample[old]
+        self._mapping_revision += 1
+
     def _update_map(self, note: str, text: str):
         # Store the full trimmed value so users can enter names like "space",
         # "enter", "f1" etc.  We normalise to lowercase to simplify lookup
         # later on.  If no characters are provided we clear the mapping for
         # that note.
         key_name = text.strip().lower()
-        self.note_map[note] = key_name
+        self._bind_key(note, key_name)
         # persist this single‑note setting
-        self.settings.setValue(note, key_name)
+        self._queue_setting(note, key_name)
 
     # -----------------------------------------------------------------
     def _toggle_start(self):
-        if self.worker and self.worker.isRunning():
+        if self._running:
             self._stop_listening()
         else:
             self._start_listening()
@@ -484,7 +886,7 @@ class MainWindow(QtWidgets.QMainWindow):
         channels = 1  # always standard input, no loopback/system output
 
         # Stop any existing worker
-        if self.worker and self.worker.isRunning():
+        if self._running:
             self._stop_listening()
 
         # Load audio parameters from settings, falling back to defaults
@@ -494,28 +896,15 @@ class MainWindow(QtWidgets.QMainWindow):
         # noise floor via calibration supersedes this calibration
         # duration.
         gate_dur = constants.NOISE_GATE_CALIBRATION_TIME
-        gate_margin = float(
-            self.settings.value("noise_gate_margin", constants.NOISE_GATE_MARGIN)
-        )
-        hp_cutoff = float(self.settings.value("hp_cutoff", constants.HP_FILTER_CUTOFF))
-        sample_rate = int(self.settings.value("sample_rate", constants.SAMPLE_RATE))
-        buffer_size = int(self.settings.value("buffer_size", constants.BUFFER_SIZE))
-        hop_size = int(self.settings.value("hop_size", constants.HOP_SIZE))
-        match_method = str(
-            self.settings.value("detection_method", constants.MATCH_METHOD)
-        )
-        noise_floor_key = f"noise_floor_{idx}"
-        noise_floor_val = self.settings.value(noise_floor_key, None)
-        preset_floor = None
-        try:
-            if noise_floor_val is not None:
-                preset_floor = float(noise_floor_val)
-        except Exception:
-            preset_floor = None
-
-        match_thresh = float(
-            self.settings.value("match_threshold", constants.MATCH_THRESHOLD)
-        )
+        cfg = self._audio_config()
+        gate_margin = cfg["noise_gate_margin"]
+        hp_cutoff = cfg["hp_cutoff"]
+        sample_rate = cfg["sample_rate"]
+        buffer_size = cfg["buffer_size"]
+        hop_size = cfg["hop_size"]
+        match_method = cfg["detection_method"]
+        match_thresh = cfg["match_threshold"]
+        preset_floor = _read_noise_floor(self.settings, idx)
 
         self.worker = SoundWorker(
             idx,
@@ -533,29 +922,40 @@ class MainWindow(QtWidgets.QMainWindow):
             match_method=match_method,
             send_enabled=not getattr(self, "test_mode", False),
         )
-        self.worker.keyDetected.connect(self._on_key_detected)
-        self.worker.finished.connect(self._on_worker_done)
-        self.worker.amplitudeChanged.connect(self._on_amplitude_changed)
+        # Queued explicitly: both signals come from the worker thread.
+        queued = QtCore.Qt.QueuedConnection
+        self.worker.keyDetected.connect(self._on_key_detected, queued)
+        self.worker.finished.connect(self._on_worker_done, queued)
         self.worker.start()
+        self._running = True
+        self._sync_amp_timer()
 
         self.start_btn.setText("Stop Listening")
         self.listen_lbl.setVisible(True)
 
     def _stop_listening(self):
         if self.worker:
+            # Detach first so detections still queued from the old worker
+            # are not delivered once the UI has been reset below.
+            try:
+                self.worker.keyDetected.disconnect(self._on_key_detected)
+                self.worker.finished.disconnect(self._on_worker_done)
+            except (RuntimeError, TypeError):
+                pass
             self.worker.stop()
             self.worker = None
+        self._running = False
+        self._sync_amp_timer()
 
         self.start_btn.setText("Start Listening")
         self.listen_lbl.setVisible(False)
         # Reset meters when stopping
-        if hasattr(self, "level_bar"):
-            self.level_bar.setValue(0)
+        self._set_level(0)
         # Clear the output log so that new sessions start
         # fresh.  Without clearing the log, previous
         # detections persist and can cause confusion.
-        if hasattr(self, "log"):
-            self.log.clear()
+        self._log_buf.clear()
+        self.log.clear()
 
     # -----------------------------------------------------------------
     # Worker callbacks
@@ -563,24 +963,40 @@ class MainWindow(QtWidgets.QMainWindow):
         """Handle a detected key press from the worker thread."""
 
         self._append_log(f"Detected {key} ({score:.2f})")
-        if key in self.key_labels:
-            lbl = self.key_labels[key]
-            lbl.setStyleSheet("background-color: yellow")
-            QtCore.QTimer.singleShot(300, lambda: lbl.setStyleSheet(""))
+        timer = self._highlight_timers.get(key)
+        if timer is None:
+            return
+        # A label already highlighted only has its timer restarted.
+        if not timer.isActive():
+            self.key_labels[key].setStyleSheet(_HIGHLIGHT_QSS)
+        timer.start()
 
     def _on_worker_done(self) -> None:
         """Reset the interface when the background worker stops."""
 
+        self._running = False
+        self._sync_amp_timer()
         self.start_btn.setText("Start Listening")
         self.listen_lbl.setVisible(False)
-        if hasattr(self, "level_bar"):
-            self.level_bar.setValue(0)
+        self._set_level(0)
 
     # -----------------------------------------------------------------
     def _append_log(self, msg: str) -> None:
-        """Append ``msg`` to the output log."""
+        """Queue ``msg`` for the output log; see :meth:`_flush_log`."""
 
-        self.log.appendPlainText(msg)
+        self._log_buf.append(msg)
+        if len(self._log_buf) > _LOG_BUFFER_MAX:
+            del self._log_buf[:-_LOG_BUFFER_MAX]
+        if not self._log_timer.isActive():
+            self._log_timer.start()
+
+    def _flush_log(self) -> None:
+        """Write all queued log lines to the output log in one append."""
+
+        if not self._log_buf:
+            return
+        self.log.appendPlainText("\n".join(self._log_buf))
+        self._log_buf.clear()
         self.log.ensureCursorVisible()
 
     # -----------------------------------------------------------------
@@ -597,7 +1013,7 @@ class MainWindow(QtWidgets.QMainWindow):
         if key_dlg.exec() != QtWidgets.QDialog.Accepted:
             return
         key_name = key_dlg.get_selected_key()
-        if key_name in self.note_map.values():
+        if key_name in self._key_to_sample:
             QtWidgets.QMessageBox.warning(
                 self, "Key in use", f"{key_name} is already mapped."
             )
@@ -620,16 +1036,9 @@ class MainWindow(QtWidgets.QMainWindow):
             return
 
         sample_id = base  # use exactly what the user provided, no underscore suffixing
-        refs: list[np.ndarray] = []
-        paths: list[str] = []
-        for i, sample in enumerate(samp_dlg.samples):
-            refs.append(sample)
-            path = self.data_dir / f"{sample_id}_{i}.npy"
-            np.save(path, sample)
-            paths.append(str(path))
-        self.samples[sample_id] = refs
-        self.note_map[sample_id] = key_name
-        self.sample_files[sample_id] = paths
+        self.samples[sample_id] = list(samp_dlg.samples)
+        self._bind_key(sample_id, key_name)
+        self.sample_files[sample_id] = [self._write_sample_cache(sample_id)]
         self._add_mapping_row(sample_id, key_name)
         self._save_mappings()
 
@@ -644,39 +1053,30 @@ class MainWindow(QtWidgets.QMainWindow):
         key_lbl = QtWidgets.QLineEdit(key_name)
         key_lbl.setReadOnly(True)
         self.key_labels[sample_id] = key_lbl
-
-        change_btn = make_svg_toolbutton(
-            resource_path("assets/keyboard.svg"),
-            "Change Key",
-            lambda _, s=sample_id: self._change_key(s),
-        )
-        edit_btn = make_svg_toolbutton(
-            resource_path("assets/edit.svg"),
-            "Edit Samples",
-            lambda _, s=sample_id: self._edit_samples(s),
-        )
-        del_btn = make_svg_toolbutton(
-            resource_path("assets/delete.svg"),
-            "Delete Mapping",
-            lambda _, s=sample_id: self._delete_mapping(s),
-        )
-
-        # change_btn.setIconSize(QSize(16, 16))
-        # edit_btn.setIconSize(QSize(16, 16))
-        # del_btn.setIconSize(QSize(16, 16))
+        # Reused for every detection of this key; owned by the label.
+        timer = QtCore.QTimer(key_lbl)
+        timer.setSingleShot(True)
+        timer.setInterval(_HIGHLIGHT_MS)
+        timer.timeout.connect(partial(key_lbl.setStyleSheet, ""))
+        self._highlight_timers[sample_id] = timer
 
         row.addWidget(lbl)
         row.addWidget(key_lbl)
-        row.addWidget(change_btn)
-        row.addWidget(edit_btn)
-        row.addWidget(del_btn)
+        for icon, tooltip, method in _ROW_ACTIONS:
+            row.addWidget(
+                make_svg_toolbutton(
+                    resource_path(icon),
+                    tooltip,
+                    partial(getattr(self, method), sample_id),
+                )
+            )
         return container
 
     def _add_mapping_row(self, sample_id: str, key_name: str) -> None:
         widget = self._make_mapping_row_widget(sample_id, key_name)
         self.mapping_widgets[sample_id] = widget
         # If the key-mapping window is open, refresh its contents so it's in sync.
-        if hasattr(self, "keymapping_window") and self.keymapping_window:
+        if self.keymapping_window is not None:
             self.keymapping_window.refresh()
 
     def _edit_samples(self, sample_id: str) -> None:
@@ -697,44 +1097,48 @@ class MainWindow(QtWidgets.QMainWindow):
         if dlg.exec() != QtWidgets.QDialog.Accepted:
             return
 
+        # The dialog packs its takes into a fresh block on accept, so none
+        # are memory-mapped views of the files about to be unlinked.
+        self.samples[sample_id] = list(dlg.samples)
+        cache = self._write_sample_cache(sample_id)
+        # The current cache is replaced atomically by the queued write, so it
+        # survives a failed save; only legacy files are removed here.
         for path in self.sample_files.get(sample_id, []):
-            Path(path).unlink(missing_ok=True)
+            if path != cache:
+                Path(path).unlink(missing_ok=True)
 
-        self.samples[sample_id] = dlg.samples[:]
-        paths: list[str] = []
-        for i, sample in enumerate(dlg.samples):
-            path = self.data_dir / f"{sample_id}_{i}.npy"
-            np.save(path, sample)
-            paths.append(str(path))
-        self.sample_files[sample_id] = paths
-        self._save_mappings()
+        self.sample_files[sample_id] = [cache]
+        self._save_sample_files()
 
     def _change_key(self, sample_id: str) -> None:
-        if self.worker and self.worker.isRunning():
+        if self._running:
             self._stop_listening()
         current = self.note_map.get(sample_id, "")
         dlg = KeySelectDialog(self, sample_id, current)
         if dlg.exec() == QtWidgets.QDialog.Accepted:
             key = dlg.get_selected_key()
-            if key in self.note_map.values() and self.note_map.get(sample_id) != key:
+            if self._key_to_sample.get(key, sample_id) != sample_id:
                 QtWidgets.QMessageBox.warning(
                     self, "Key in use", f"{key} is already mapped."
                 )
                 return
-            self.note_map[sample_id] = key
+            self._bind_key(sample_id, key)
             if sample_id in self.key_labels:
                 self.key_labels[sample_id].setText(key)
-            self._save_mappings()
-            if hasattr(self, "keymapping_window") and self.keymapping_window:
+            self._save_note_map()
+            if self.keymapping_window is not None:
                 self.keymapping_window.refresh()
 
     def _delete_mapping(self, sample_id: str) -> None:
         if sample_id in self.samples:
             del self.samples[sample_id]
-        if sample_id in self.note_map:
-            del self.note_map[sample_id]
+        self._unbind_key(sample_id)
         if sample_id in self.key_labels:
             del self.key_labels[sample_id]
+        self._highlight_timers.pop(sample_id, None)
+        # A queued cache write could otherwise recreate a file unlinked below
+        for job in self._cache_jobs.pop(sample_id, []):
+            job.cancel()
         paths = self.sample_files.pop(sample_id, [])
         for path in paths:
             Path(path).unlink(missing_ok=True)
@@ -743,15 +1147,52 @@ class MainWindow(QtWidgets.QMainWindow):
             widget.setParent(None)
         self._save_mappings()
 
-        if hasattr(self, "keymapping_window") and self.keymapping_window:
+        if self.keymapping_window is not None:
             self.keymapping_window.refresh()
 
     # -----------------------------------------------------------------
     # Amplitude meter callback
-    def _on_amplitude_changed(self, rms: float) -> None:
-        # Simple linear scaling: convert RMS (typically 0–1) into a 0–100 range
-        level = min(int(rms * 300.0), 100)
-        self.level_bar.setValue(level)
+    def _on_amplitude_changed(self) -> None:
+        """Refresh the level bar from the worker; driven by ``_amp_timer``."""
+        if self.worker is None:
+            return
+        rms = self.worker.latest_amplitude
+        self._set_level(_rms_to_level(rms))
+
+    def _set_level(self, level: int) -> None:
+        """Show ``level`` on the meter, skipping repaints when unchanged."""
+        if level != self._last_level:
+            self._last_level = level
+            self.level_bar.setValue(level)
+
+    def _sync_amp_timer(self) -> None:
+        """Run the meter timer only while visible and a worker is capturing."""
+        if self._running and self.isVisible():
+            if not self._amp_timer.isActive():
+                self._amp_timer.start()
+        else:
+            self._amp_timer.stop()
+
+    def showEvent(self, event: QtGui.QShowEvent) -> None:
+        super().showEvent(event)
+        self._sync_amp_timer()
+        if not self._samples_requested:
+            # Queued behind the first paint, so the window appears before
+            # the sample files are read from disk
+            self._samples_requested = True
+            QtCore.QTimer.singleShot(0, self._load_samples)
+
+    def hideEvent(self, event: QtGui.QHideEvent) -> None:
+        # No point repainting the meter while minimised or hidden
+        self._amp_timer.stop()
+        super().hideEvent(event)
+
+    def closeEvent(self, event: QtGui.QCloseEvent) -> None:
+        # Don't lose mapping edits still waiting on the debounce timer, or
+        # sample caches still being written
+        self._flush_settings()
+        self._save_pool.waitForDone()
+        super().closeEvent(event)
 
     # -----------------------------------------------------------------
     # -----------------------------------------------------------------
@@ -770,9 +1211,9 @@ class MainWindow(QtWidgets.QMainWindow):
             The new state of the checkbox.
         """
         self.test_mode = bool(checked)
-        self.settings.setValue("test_mode", self.test_mode)
+        self._queue_setting("test_mode", self.test_mode)
         # Update the running worker (if any) to enable/disable key sending
-        if self.worker and self.worker.isRunning():
+        if self._running:
             try:
                 self.worker.set_send_enabled(not self.test_mode)
             except Exception:
@@ -781,39 +1222,68 @@ class MainWindow(QtWidgets.QMainWindow):
     def _create_audio_input_menu(self) -> None:
         audio_menu = self.menuBar().addMenu("Audio Input")
         self.audio_input_menu = audio_menu  # keep reference for lookup
-        device_group = QtGui.QActionGroup(self)
-        device_group.setExclusive(True)
+        self._device_group = QtGui.QActionGroup(self)
+        self._device_group.setExclusive(True)
+        self._device_group.triggered.connect(self._on_device_triggered)
+        audio_menu.aboutToShow.connect(self._on_audio_input_menu_shown)
+
+    def _on_audio_input_menu_shown(self) -> None:
+        """Fill the Audio Input menu, or show a placeholder while the
+        start-up enumeration is still running."""
+        if self._device_enum is not None:
+            menu = self.audio_input_menu
+            menu.clear()
+            act = QtGui.QAction("Refreshing audio devices…", menu)
+            act.setEnabled(False)
+            menu.addAction(act)
+            self._device_menu_dirty = True
+            return
+        self._ensure_audio_input_menu()
+
+    def _ensure_audio_input_menu(self) -> None:
+        """Fill the Audio Input menu if it has not been built since the
+        device list was last invalidated or the cached list has expired."""
+        expired = time.monotonic() - self._device_cache_ts >= _DEVICE_CACHE_TTL
+        if self._device_menu_dirty or expired:
+            self._fill_audio_input_menu()
+
+    def _fill_audio_input_menu(self) -> None:
+        """(Re)build the Audio Input menu from the cached device list."""
+        self._device_menu_dirty = False
+        audio_menu = self.audio_input_menu
+        audio_menu.clear()
+        device_group = self._device_group
 
         if sd is None:
-            act = QtGui.QAction("sounddevice module not available", self)
+            act = QtGui.QAction("sounddevice module not available", audio_menu)
             act.setEnabled(False)
             audio_menu.addAction(act)
             return
 
+        refresh_action = audio_menu.addAction("Refresh Devices")
+        refresh_action.triggered.connect(self._refresh_devices)
+        audio_menu.addSeparator()
+
         try:
-            devices = sd.query_devices()
+            devices, _ = self._device_snapshot()
         except Exception as e:
-            act = QtGui.QAction(f"Audio enumeration failed: {e}", self)
+            act = QtGui.QAction(f"Audio enumeration failed: {e}", audio_menu)
             act.setEnabled(False)
             audio_menu.addAction(act)
             return
 
-        def is_monitor(name: str) -> bool:
-            n = name.lower()
-            return ("monitor" in n) or ("loopback" in n)
-
         for idx, dev in enumerate(devices):
             if dev.get("max_input_channels", 0) < 1:
                 continue
             name = dev["name"]
-            if is_monitor(name):
+            if _is_monitor(name):
                 continue  # skip virtual monitors/loopbacks
             label = f"{idx}: {name}"
-            action = QtGui.QAction(label, self, checkable=True)
+            # parented to the menu so ``clear()`` disposes of it on refresh
+            action = QtGui.QAction(label, audio_menu, checkable=True)
             action.setData(idx)
             device_group.addAction(action)
             audio_menu.addAction(action)
-            action.triggered.connect(lambda checked, i=idx: self._select_device(i))
 
         # Restore preferred input device
         preferred = self.settings.value("device_in", None)
@@ -824,23 +1294,29 @@ class MainWindow(QtWidgets.QMainWindow):
                 default_in = None
             preferred = default_in
 
-        for action in audio_menu.actions():
+        actions = audio_menu.actions()
+        selected = False
+        for action in actions:
             data = action.data()
             if data is None:
                 continue
             try:
                 if preferred is not None and int(data) == int(preferred):
                     action.setChecked(True)
+                    selected = True
             except Exception:
                 pass
 
         # Fallback to first real device if none selected
-        if not any(a.isChecked() for a in audio_menu.actions()):
-            for a in audio_menu.actions():
+        if not selected:
+            for a in actions:
                 if a.isEnabled() and a.data() is not None:
                     a.setChecked(True)
                     break
 
+        checked = device_group.checkedAction()
+        self._checked_device_idx = checked.data() if checked else None
+
     def _update_device_menu(self) -> None:
         """Rebuild the Device submenu showing all physical input devices."""
         self.device_menu.clear()
@@ -906,11 +1382,21 @@ class MainWindow(QtWidgets.QMainWindow):
         ):
             self.device_menu.actions()[0].setChecked(True)
 
+    def _on_device_triggered(self, action: QtGui.QAction) -> None:
+        """Select the device stored on a triggered device-menu action."""
+        self._select_device(int(action.data()))
+
     def _select_device(self, idx: int) -> None:
         key = "device_in"
+        self._checked_device_idx = idx
         self.settings.setValue(key, idx)
 
     def current_device_index(self):
+        if self._checked_device_idx is not None:
+            return self._checked_device_idx
+        self._ensure_audio_input_menu()
+        if self._checked_device_idx is not None:
+            return self._checked_device_idx
         # prefer new flat audio_input_menu
         for action in getattr(self, "audio_input_menu", []).actions():
             if action.isChecked():
@@ -934,6 +1420,9 @@ class MainWindow(QtWidgets.QMainWindow):
           default web browser.
         * **Help → About** shows an About dialogue describing the
           application.
+
+        The Settings and Help actions are only created the first time
+        their menu is opened.
         """
         menubar = self.menuBar()
 
@@ -943,17 +1432,27 @@ class MainWindow(QtWidgets.QMainWindow):
         exit_action.triggered.connect(self.close)
 
         # Settings menu containing audio parameters
-        settings_menu = menubar.addMenu("Settings")
-        audio_action = settings_menu.addAction("Audio Parameters…")
-        audio_action.triggered.connect(self._open_settings_dialogue)
+        self.settings_menu = menubar.addMenu("Settings")
+        self.settings_menu.aboutToShow.connect(self._populate_settings_menu)
 
         self._create_audio_input_menu()
 
         # Help menu providing docs and about
-        help_menu = menubar.addMenu("Help")
-        docs_action = help_menu.addAction("Visit Docs")
+        self.help_menu = menubar.addMenu("Help")
+        self.help_menu.aboutToShow.connect(self._populate_help_menu)
+
+    def _populate_settings_menu(self) -> None:
+        """Add the Settings actions on first show."""
+        self.settings_menu.aboutToShow.disconnect(self._populate_settings_menu)
+        audio_action = self.settings_menu.addAction("Audio Parameters…")
+        audio_action.triggered.connect(self._open_settings_dialogue)
+
+    def _populate_help_menu(self) -> None:
+        """Add the Help actions on first show."""
+        self.help_menu.aboutToShow.disconnect(self._populate_help_menu)
+        docs_action = self.help_menu.addAction("Visit Docs")
         docs_action.triggered.connect(self._visit_docs)
-        about_action = help_menu.addAction("About")
+        about_action = self.help_menu.addAction("About")
         about_action.triggered.connect(self._show_about)
 
     # -----------------------------------------------------------------
@@ -972,10 +1471,13 @@ class MainWindow(QtWidgets.QMainWindow):
         """
         # Stop listening up front to avoid interference from the
         # audio worker while tweaking settings.
-        if self.worker and self.worker.isRunning():
+        if self._running:
             self._stop_listening()
 
-        dlg = SettingsDialog(self)
+        # Built on first use and kept; it resets its editors on cancel.
+        if self._settings_dlg is None:
+            self._settings_dlg = SettingsDialog(self)
+        dlg = self._settings_dlg
         if dlg.exec() == QtWidgets.QDialog.Accepted:
             # The settings dialogue persists values via QSettings on accept.
             # Previously the worker would restart automatically here, but
@@ -992,8 +1494,7 @@ class MainWindow(QtWidgets.QMainWindow):
         browser.  The URL is stored in a module constant for easy
         maintenance; if you fork the project, update the link here.
         """
-        url = QtCore.QUrl("https://github.com/lewis-morris/audiokeys")
-        QtGui.QDesktopServices.openUrl(url)
+        QtGui.QDesktopServices.openUrl(_DOCS_URL)
 
     # -----------------------------------------------------------------
     def _show_about(self) -> None:
@@ -1002,20 +1503,10 @@ class MainWindow(QtWidgets.QMainWindow):
         application, including its version and author.  The contents
         here can be customised to reflect project metadata.
         """
-
-        about_text = (
-            "<h3>AudioKeys</h3>"
-            "<p>Turn sound into action. Record distinctive audio samples and map them to key presses — "
-            "control your computer using just your voice or custom noises.</p>"
-            "<p>Built by Lewis Morris (Arched.dev), this project is fully open source.</p>"
-            "<p>Explore the code, report issues or contribute on "
-            "<a href='https://github.com/lewis-morris/audiokeys'>GitHub</a>. "
-            "Distributed under the MIT License.</p>"
-        )
         QtWidgets.QMessageBox.about(
             self,
             "About AudioKeys",
-            about_text,
+            _ABOUT_HTML,
         )
 
 
@@ -1057,58 +1548,277 @@ def run_gui():
 # ─── Dialogs ────────────────────────────────────────────────────────────────
 
 
+class DeviceEnumWorker(QtCore.QThread):
+    """Background thread that lists PortAudio devices and host APIs.
+
+    The lists are kept in ``result`` and emitted through ``devicesReady``.
+    If enumeration fails nothing is emitted; the next query on the GUI
+    thread reports the error.
+    """
+
+    devicesReady = QtCore.Signal(list, list)
+
+    def __init__(self, parent: Optional[QtCore.QObject] = None) -> None:
+        super().__init__(parent)
+        self.result: Optional[tuple[list[dict], list[dict]]] = None
+
+    def run(self) -> None:
+        try:
+            self.result = (list(sd.query_devices()), list(sd.query_hostapis()))
+        except Exception:
+            return
+        self.devicesReady.emit(*self.result)
+
+
 class RecordingThread(QtCore.QThread):
-    """Background thread that records audio while emitting amplitude updates."""
+    """Background thread that records audio while publishing its level.
+
+    The RMS of the most recent block is stored in ``latest_amplitude`` for
+    the dialogue's meter timer to poll, rather than queuing a signal for
+    every block.  ``recorded`` always carries a contiguous mono ``float32``
+    array, so consumers can trim, play and match it without converting.
+    """
 
     recorded = QtCore.Signal(np.ndarray)
-    amplitude = QtCore.Signal(float)
 
     def __init__(self, device_index: int) -> None:
         super().__init__()
         self.device_index = device_index
+        self.latest_amplitude: float = 0.0
         self._stop = threading.Event()
 
     def run(self) -> None:  # noqa: D401 - custom loop for amplitude updates
-        """Capture audio until silence and emit RMS amplitude during recording."""
+        """Capture audio until silence, tracking the RMS of each block."""
 
         import sounddevice as sd
 
-        frames: list[np.ndarray] = []
+        hop = constants.HOP_SIZE
+        # Blocks are written straight into one float32 buffer that doubles
+        # when full, so the take is never rebuilt from a list of blocks.
+        buf = np.empty(constants.SAMPLE_RATE * 2, dtype=np.float32)
+        pos = 0
         silent = 0
         required = int(constants.NOISE_GATE_CALIBRATION_TIME * constants.SAMPLE_RATE)
+
+        def callback(indata, frames, _time, _status) -> None:
+            # Runs on PortAudio's thread; this thread only waits for the
+            # stop event, which the callback sets once silence is reached.
+            nonlocal buf, pos, silent
+            block = indata[:, 0]
+            if pos + frames > buf.size:
+                buf = np.resize(buf, max(buf.size * 2, pos + frames))
+            buf[pos : pos + frames] = block
+            pos += frames
+            rms = float(np.sqrt(np.mean(block**2)))
+            self.latest_amplitude = rms
+            if rms < 0.01:
+                silent += frames
+                if silent >= required and pos > hop:
+                    self._stop.set()
+                    raise sd.CallbackStop
+            else:
+                silent = 0
+
         with sd.InputStream(
             device=self.device_index,
             channels=1,
             samplerate=constants.SAMPLE_RATE,
-            blocksize=constants.HOP_SIZE,
+            blocksize=hop,
             dtype="float32",
+            callback=callback,
         ) as stream:
-            while not self._stop.is_set():
-                data, _ = stream.read(constants.HOP_SIZE)
-                block = data.reshape(-1)
-                frames.append(block)
-                rms = float(np.sqrt(np.mean(block**2)))
-                self.amplitude.emit(rms)
-                if rms < 0.01:
-                    silent += constants.HOP_SIZE
-                    if (
-                        silent >= required
-                        and sum(len(x) for x in frames) > constants.HOP_SIZE
-                    ):
-                        break
-                else:
-                    silent = 0
-        if frames:
-            sample = np.concatenate(frames)
-        else:
-            sample = np.array([], dtype=np.float32)
-        self.recorded.emit(sample)
+            # Poll rather than block: if the device errors out or is
+            # unplugged the stream goes inactive without the callback ever
+            # setting the event, so keep whatever was captured so far.
+            while not self._stop.wait(0.1):
+                if not stream.active:
+                    break
+        # Leaving the ``with`` block stops the stream, after which the
+        # callback no longer touches ``buf``.
+        self.recorded.emit(buf[:pos].copy())
 
     def stop(self) -> None:
         """Request the recording thread to stop."""
         self._stop.set()
 
 
+class CalibrationThread(QtCore.QThread):
+    """Background thread that measures the ambient noise floor of a device.
+
+    Audio passes through the same high-pass filter ``sos`` as
+    :class:`SoundWorker` applies before gating, so the stored floor is
+    comparable with the levels the gate later measures.  ``progress``
+    reports the captured share of the window as a percentage so the
+    dialogue can show a determinate bar.
+    """
+
+    progress = QtCore.Signal(int)
+    calibrated = QtCore.Signal(float)
+    failed = QtCore.Signal(str)
+
+    def __init__(
+        self,
+        device_index: int,
+        sample_rate: int,
+        sos: np.ndarray,
+        duration: float = 2.0,
+    ) -> None:
+        super().__init__()
+        self.device_index = device_index
+        self.sample_rate = sample_rate
+        self.sos = sos
+        self.duration = duration
+        self._stop = threading.Event()
+
+    def run(self) -> None:  # noqa: D401 - records then emits the floor
+        """Record ``duration`` seconds of audio and emit the noise floor."""
+
+        try:
+            total = int(self.sample_rate * self.duration)
+            hop = constants.HOP_SIZE
+            # The callback filters each block as it arrives, carrying the
+            # filter state across blocks, and stores only that block's RMS,
+            # so the floor is a median away once the window is full.
+            # Progress is the share of the window captured so far.
+            rms = np.empty(-(-total // hop), dtype=np.float64)
+            count = 0
+            pos = 0
+            zi: Optional[np.ndarray] = None
+            full = threading.Event()
+
+            def callback(indata, frames, _time, _status) -> None:
+                # Runs on PortAudio's thread until the window is full.
+                nonlocal rms, count, pos, zi
+                n = min(frames, total - pos)
+                block = indata[:n, 0]
+                if zi is None:
+                    # Start from steady state at the first sample so the
+                    # filter's step response doesn't inflate early blocks.
+                    zi = sosfilt_zi(self.sos) * block[0]
+                filtered, zi = sosfilt(self.sos, block, zi=zi)
+                if count == rms.size:
+                    # Only if PortAudio delivered blocks shorter than ``hop``
+                    rms = np.resize(rms, rms.size * 2)
+                rms[count] = np.sqrt(np.dot(filtered, filtered) / n)
+                count += 1
+                pos += n
+                if pos >= total:
+                    full.set()
+                    raise sd.CallbackStop
+
+            # A stream of our own, so cancelling never touches the global
+            # stream that ``sd.rec``/``sd.stop`` would share.
+            with sd.InputStream(
+                device=self.device_index,
+                channels=1,
+                samplerate=self.sample_rate,
+                blocksize=hop,
+                dtype="float32",
+                callback=callback,
+            ) as stream:
+                while not full.wait(0.1):
+                    if self._stop.is_set():
+                        return
+                    if not stream.active and not full.is_set():
+                        # Device unplugged or the callback raised
+                        self.failed.emit("The audio stream stopped unexpectedly.")
+                        return
+                    self.progress.emit(100 * pos // total)
+            self.progress.emit(100)
+            self.calibrated.emit(float(np.median(rms[:count])) if count else 0.0)
+        except Exception as e:
+            self.failed.emit(str(e))
+
+    def stop(self) -> None:
+        """Request the calibration to be cancelled."""
+        self._stop.set()
+
+
+class SampleCacheSignals(QtCore.QObject):
+    """Signals for :class:`SampleCacheJob`, which is not a ``QObject``."""
+
+    failed = QtCore.Signal(str, str)
+
+
+class SampleCacheJob(QtCore.QRunnable):
+    """Background job that writes one mapping's packed sample cache.
+
+    The cache layout is defined by :func:`write_sample_cache`.  The archive
+    is staged next to ``path`` and only moved into place if the job has not
+    been cancelled, so :meth:`cancel` guarantees the job will not create
+    ``path`` afterwards.  If the write fails ``signals.failed`` carries the
+    cache path and the error message.
+    """
+
+    def __init__(self, path: Path, samples: list[np.ndarray]) -> None:
+        super().__init__()
+        # MainWindow keeps pending jobs to cancel them; Python frees them
+        self.setAutoDelete(False)
+        self.path = path
+        self.samples = samples
+        self.signals = SampleCacheSignals()
+        self.done = False
+        self._cancelled = False
+        # Held only around the final rename, never across the write
+        self._lock = threading.Lock()
+
+    def cancel(self) -> None:
+        """Stop the job from moving its cache into place."""
+        with self._lock:
+            self._cancelled = True
+
+    def run(self) -> None:
+        staged = self.path.with_name(self.path.name + ".part")
+        try:
+            if not self._cancelled:
+                write_sample_cache(staged, self.samples)
+                with self._lock:
+                    if not self._cancelled:
+                        staged.replace(self.path)
+            staged.unlink(missing_ok=True)
+        except Exception as exc:
+            staged.unlink(missing_ok=True)
+            self.signals.failed.emit(str(self.path), str(exc))
+        finally:
+            self.done = True
+
+
+class SampleListModel(QtCore.QAbstractListModel):
+    """List model exposing recorded samples as ``Sample N`` rows.
+
+    Labels are derived from the row number, so removing a sample renumbers
+    the rows below it without touching any stored items.  The model edits
+    ``samples`` in place; callers keep sharing the same list object.
+    """
+
+    def __init__(
+        self, samples: list[np.ndarray], parent: Optional[QtCore.QObject] = None
+    ) -> None:
+        super().__init__(parent)
+        self.samples = samples
+
+    def rowCount(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.samples)
+
+    def data(self, index: QtCore.QModelIndex, role: int = QtCore.Qt.DisplayRole):
+        if role == QtCore.Qt.DisplayRole and index.isValid():
+            return f"Sample {index.row() + 1}"
+        return None
+
+    def append(self, sample: np.ndarray) -> None:
+        """Add ``sample`` as a new last row."""
+        row = len(self.samples)
+        self.beginInsertRows(QtCore.QModelIndex(), row, row)
+        self.samples.append(sample)
+        self.endInsertRows()
+
+    def remove(self, row: int) -> None:
+        """Delete the sample at ``row``."""
+        self.beginRemoveRows(QtCore.QModelIndex(), row, row)
+        self.samples.pop(row)
+        self.endRemoveRows()
+
+
 class SampleDialog(QtWidgets.QDialog):
     """Dialog for naming a sound and recording multiple samples."""
 
@@ -1139,10 +1849,10 @@ class SampleDialog(QtWidgets.QDialog):
         info_lbl = QtWidgets.QLabel("Record 5–10 samples for best results.")
         layout.addWidget(info_lbl)
 
-        self.list_widget = QtWidgets.QListWidget()
-        for idx in range(len(self.samples)):
-            self.list_widget.addItem(f"Sample {idx + 1}")
-        layout.addWidget(self.list_widget)
+        self.list_model = SampleListModel(self.samples, self)
+        self.list_view = QtWidgets.QListView()
+        self.list_view.setModel(self.list_model)
+        layout.addWidget(self.list_view)
 
         btn_layout = QtWidgets.QHBoxLayout()
         self.record_btn = QtWidgets.QPushButton("Record Sample")
@@ -1167,6 +1877,10 @@ class SampleDialog(QtWidgets.QDialog):
         self.level_bar = QtWidgets.QProgressBar()
         self.level_bar.setRange(0, 100)
         layout.addWidget(self.level_bar)
+        self._last_level = 0
+        self._amp_timer = QtCore.QTimer(self)
+        self._amp_timer.setInterval(33)
+        self._amp_timer.timeout.connect(self._on_amplitude_tick)
 
         # Label that displays detection result and confidence
         self.detect_lbl = QtWidgets.QLabel("")
@@ -1183,6 +1897,14 @@ class SampleDialog(QtWidgets.QDialog):
 
         self._thread: Optional[RecordingThread] = None
         self._test_worker: Optional[SoundWorker] = None
+        # ``sd.play`` returns immediately; this timer re-enables the Play
+        # button once the sample has had time to finish.
+        self._play_timer = QtCore.QTimer(self)
+        self._play_timer.setSingleShot(True)
+        self._play_timer.timeout.connect(self._on_playback_finished)
+        # audio parameters read on the first detection test
+        self._audio_settings: Optional[dict[str, Any]] = None
+        self._preset_floor: Optional[float] = None
 
         self.setMinimumWidth(800)
         self.setMinimumHeight(500)
@@ -1192,41 +1914,74 @@ class SampleDialog(QtWidgets.QDialog):
         if self._thread and self._thread.isRunning():
             self._thread.stop()
             return
+        # Release the test worker's stream first: some backends (WASAPI
+        # exclusive, ALSA hw devices) refuse a second stream on the device.
+        if self.test_btn.isChecked():
+            self.test_btn.setChecked(False)
         self.record_btn.setText("Stop")
         self._thread = RecordingThread(self.device_index)
         self._thread.recorded.connect(self._on_recorded)
-        self._thread.amplitude.connect(self._on_record_amplitude)
         self._thread.start()
+        self._sync_amp_timer()
+
+    def _repack(self) -> None:
+        """Copy the takes into one contiguous block and swap in views.
+
+        Done once on accept, so the stored mapping owns a single float32
+        block rather than one array per take.  ``samples`` is updated in
+        place so the list model keeps sharing the same list object.
+        """
+        if not self.samples:
+            return
+        flat = np.concatenate(self.samples, dtype=np.float32)
+        offsets = np.zeros(len(self.samples) + 1, dtype=np.int64)
+        np.cumsum([s.size for s in self.samples], out=offsets[1:])
+        bounds = zip(offsets[:-1], offsets[1:])
+        self.samples[:] = [flat[start:end] for start, end in bounds]
 
     def _on_recorded(self, sample: np.ndarray) -> None:
         if self._thread:
             self._thread.quit()
             self._thread.wait()
             self._thread = None
+        self._sync_amp_timer()
+        self._set_level(0)
         if sample.size:
+            # Normalise once at the thread boundary so trimming, playback and
+            # matching all operate on contiguous float32 data.
+            sample = np.ascontiguousarray(sample, dtype=np.float32)
             trimmed = trim_silence(sample)
             if trimmed.size:
-                self.samples.append(trimmed)
-                self.list_widget.addItem(f"Sample {len(self.samples)}")
+                self.list_model.append(trimmed)
         self.record_btn.setText("Record Sample")
 
     def _play_sample(self) -> None:
         if not sd:
             return
-        items = self.list_widget.selectedIndexes()
+        items = self.list_view.selectionModel().selectedIndexes()
         if not items:
             return
         sample = self.samples[items[0].row()]
-        sd.play(sample, 44_100)
-        sd.wait()
+        self.play_btn.setEnabled(False)
+        # Samples are float32, which sounddevice plays without conversion.
+        sd.play(sample, constants.SAMPLE_RATE)
+        self._play_timer.start(int(sample.size * 1000 / constants.SAMPLE_RATE) + 50)
+
+    def _on_playback_finished(self) -> None:
+        self.play_btn.setEnabled(True)
+
+    def _stop_playback(self) -> None:
+        if self._play_timer.isActive():
+            self._play_timer.stop()
+            sd.stop()
+            self._on_playback_finished()
 
     def _delete_sample(self) -> None:
-        items = self.list_widget.selectedIndexes()
+        items = self.list_view.selectionModel().selectedIndexes()
         if not items:
             return
         idx = items[0].row()
-        self.samples.pop(idx)
-        self.list_widget.takeItem(idx)
+        self.list_model.remove(idx)
 
     def _toggle_test(self, checked: bool) -> None:
         """Start or stop live matching against the recorded samples."""
@@ -1239,107 +1994,106 @@ class SampleDialog(QtWidgets.QDialog):
                 self.test_btn.setChecked(False)
                 return
 
-            parent = self.parent()
-            settings = parent.settings if hasattr(parent, "settings") else None
-            sample_rate = (
-                int(settings.value("sample_rate", constants.SAMPLE_RATE))
-                if settings
-                else constants.SAMPLE_RATE
-            )
-            buffer_size = (
-                int(settings.value("buffer_size", constants.BUFFER_SIZE))
-                if settings
-                else constants.BUFFER_SIZE
-            )
-            gate_margin = (
-                float(settings.value("noise_gate_margin", constants.NOISE_GATE_MARGIN))
-                if settings
-                else constants.NOISE_GATE_MARGIN
-            )
-            hp_cutoff = (
-                float(settings.value("hp_cutoff", constants.HP_FILTER_CUTOFF))
-                if settings
-                else constants.HP_FILTER_CUTOFF
-            )
-            match_thresh = (
-                float(settings.value("match_threshold", constants.MATCH_THRESHOLD))
-                if settings
-                else constants.MATCH_THRESHOLD
-            )
-
-            match_method = (
-                str(settings.value("detection_method", constants.MATCH_METHOD))
-                if settings
-                else constants.MATCH_METHOD
-            )
-
-            noise_floor_key = f"noise_floor_{self.device_index}"
-            preset_floor = None
-            if settings:
-                nf = settings.value(noise_floor_key, None)
-                try:
-                    if nf is not None:
-                        preset_floor = float(nf)
-                except Exception:
-                    preset_floor = None
-
             sample_id = self.name_edit.text() or "sample"
-            mapping = {sample_id: self.samples}
-            note_map = {sample_id: ""}
-
+            # Settings can't change while this modal dialogue is open, so
+            # read them once and reuse the snapshot for later toggles.
+            if self._audio_settings is None:
+                parent = self.parent()
+                settings = parent.settings if hasattr(parent, "settings") else None
+                if hasattr(parent, "_audio_config"):
+                    self._audio_settings = parent._audio_config()
+                else:
+                    self._audio_settings = _read_audio_settings(settings)
+                self._preset_floor = _read_noise_floor(settings, self.device_index)
+            snap = self._audio_settings
+            gate_margin = snap["noise_gate_margin"]
+            match_thresh = snap["match_threshold"]
+            match_method = snap["detection_method"]
+
+            # Each test opens its own stream; it is closed again when the
+            # test is switched off so the device is free for recording.
             self._test_worker = SoundWorker(
                 self.device_index,
-                mapping,
-                note_map,
+                {sample_id: self.samples},
+                {sample_id: ""},
                 channels=1,
-                sample_rate=sample_rate,
-                buffer_size=buffer_size,
+                sample_rate=snap["sample_rate"],
+                buffer_size=snap["buffer_size"],
                 hop_size=constants.HOP_SIZE,
-                hp_cutoff=hp_cutoff,
+                hp_cutoff=snap["hp_cutoff"],
                 noise_gate_duration=constants.NOISE_GATE_CALIBRATION_TIME,
                 noise_gate_margin=gate_margin,
-                preset_noise_floor=preset_floor,
+                preset_noise_floor=self._preset_floor,
                 match_threshold=match_thresh,
                 match_method=match_method,
                 send_enabled=False,
             )
             self._test_worker.keyDetected.connect(self._on_test_detected)
-            self._test_worker.amplitudeChanged.connect(self._on_test_amplitude)
             self._test_worker.start()
             self.test_btn.setText("Stop Test")
+            self._sync_amp_timer()
         else:
-            if self._test_worker:
-                self._test_worker.stop()
-                self._test_worker = None
+            self._stop_test_worker()
             self.test_btn.setText("Test Detection")
             self.detect_lbl.clear()
-            self.level_bar.setValue(0)
+            self._sync_amp_timer()
+            self._set_level(0)
+
+    def _stop_test_worker(self) -> None:
+        """Stop the detection test and close its input stream."""
+        if self._test_worker is not None:
+            self._test_worker.keyDetected.disconnect(self._on_test_detected)
+            self._test_worker.stop()
+            self._test_worker = None
 
     def _on_test_detected(self, key: str, score: float) -> None:
         """Display the detected sample identifier and confidence score."""
 
         self.detect_lbl.setText(f"Detected {key} ({score:.2f})")
 
-    def _on_test_amplitude(self, rms: float) -> None:
-        """Update the level bar using the RMS amplitude during testing."""
+    def _on_amplitude_tick(self) -> None:
+        """Update the level bar from the active recording or test worker."""
 
-        level = min(int(rms * 300.0), 100)
-        self.level_bar.setValue(level)
+        if self._thread is not None:
+            rms = self._thread.latest_amplitude
+        elif self._test_worker is not None and self.test_btn.isChecked():
+            rms = self._test_worker.latest_amplitude
+        else:
+            return
+        self._set_level(_rms_to_level(rms))
+
+    def _set_level(self, level: int) -> None:
+        """Show ``level`` on the meter, skipping repaints when unchanged."""
+        if level != self._last_level:
+            self._last_level = level
+            self.level_bar.setValue(level)
+
+    def _sync_amp_timer(self) -> None:
+        """Run the meter timer only while visible and recording or testing."""
+        live = self._thread is not None or (
+            self._test_worker is not None and self.test_btn.isChecked()
+        )
+        if self.isVisible() and live:
+            if not self._amp_timer.isActive():
+                self._amp_timer.start()
+        else:
+            self._amp_timer.stop()
 
-    def _on_record_amplitude(self, rms: float) -> None:
-        """Update the level bar while recording samples."""
+    def showEvent(self, event: QtGui.QShowEvent) -> None:
+        super().showEvent(event)
+        self._sync_amp_timer()
 
-        level = min(int(rms * 300.0), 100)
-        self.level_bar.setValue(level)
+    def hideEvent(self, event: QtGui.QHideEvent) -> None:
+        # No point repainting the meter while minimised or hidden
+        self._amp_timer.stop()
+        super().hideEvent(event)
 
     def reject(self) -> None:  # noqa: D401 - close dialogue
+        self._stop_playback()
         if self._thread and self._thread.isRunning():
             self._thread.stop()
             self._thread.wait()
-        if self._test_worker and self._test_worker.isRunning():
-            self._test_worker.stop()
-            self._test_worker.wait(2000)
-            self._test_worker = None
+        self._stop_test_worker()
         super().reject()
 
     def accept(self) -> None:
@@ -1351,10 +2105,9 @@ class SampleDialog(QtWidgets.QDialog):
         if not self.name_edit.text().strip():
             QtWidgets.QMessageBox.warning(self, "No name", "Provide a sound name.")
             return
-        if self._test_worker and self._test_worker.isRunning():
-            self._test_worker.stop()
-            self._test_worker.wait(2000)
-            self._test_worker = None
+        self._stop_playback()
+        self._stop_test_worker()
+        self._repack()
         super().accept()
 
     def get_name(self) -> str:
@@ -1383,43 +2136,12 @@ class KeySelectDialog(QtWidgets.QDialog):
         info_label = QtWidgets.QLabel(f"Choose a key to trigger note <b>{note}</b>:")
         layout.addWidget(info_label)
 
-        # Available keys: letters, digits, special names and function keys
-        keys = []
-        # Letters a–z
-        keys.extend([chr(c) for c in range(ord("a"), ord("z") + 1)])
-        # Digits 0–9
-        keys.extend([str(d) for d in range(10)])
-        # Special names
-        specials = [
-            "space",
-            "enter",
-            "return",
-            "tab",
-            "esc",
-            "escape",
-            "left",
-            "right",
-            "up",
-            "down",
-            "home",
-            "end",
-            "pageup",
-            "pagedown",
-            "backspace",
-            "delete",
-            "capslock",
-        ]
-        keys.extend(specials)
-        # Function keys f1–f12
-        keys.extend([f"f{i}" for i in range(1, 13)])
-        # Remove duplicates and sort
-        unique_keys = sorted(dict.fromkeys(keys))
-
         self.combo = QtWidgets.QComboBox()
-        self.combo.addItems(unique_keys)
+        self.combo.setModel(_key_choices_model())
         # Preselect current key if present
         if current_key:
-            idx = self.combo.findText(current_key, QtCore.Qt.MatchFixedString)
+            key = current_key.lower()
+            idx = _KEY_INDEX.get(_KEY_ALIASES.get(key, key), -1)
             if idx >= 0:
                 self.combo.setCurrentIndex(idx)
         layout.addWidget(self.combo)
@@ -1434,7 +2156,8 @@ class KeySelectDialog(QtWidgets.QDialog):
         layout.addWidget(buttons)
 
     def accept(self) -> None:
-        self.selected_key = self.combo.currentText().strip().lower()
+        key = self.combo.currentText().strip().lower()
+        self.selected_key = _KEY_ALIASES.get(key, key)
         super().accept()
 
     def get_selected_key(self) -> str:
@@ -1457,25 +2180,27 @@ class SettingsDialog(QtWidgets.QDialog):
         form = QtWidgets.QFormLayout()
         layout.addLayout(form)
 
-        settings = parent.settings
+        cfg = parent._audio_config()
+        # One small-print font shared by every description label
+        desc_font = QtGui.QFont(desc.font())
+        desc_font.setPointSize(desc_font.pointSize() - 1)
 
         def make_field(
-            spinbox: QtWidgets.QDoubleSpinBox, description: str
+            editor: QtWidgets.QWidget, description: str
         ) -> QtWidgets.QWidget:
+            """Stack ``editor`` above a small-print ``description``."""
             container = QtWidgets.QWidget()
             v = QtWidgets.QVBoxLayout(container)
             v.setContentsMargins(0, 0, 0, 0)
-            v.addWidget(spinbox)
-            desc = QtWidgets.QLabel(description)
-            desc.setWordWrap(True)
-            font = desc.font()
-            font.setPointSize(font.pointSize() - 1)
-            desc.setFont(font)
-            v.addWidget(desc)
+            v.addWidget(editor)
+            label = QtWidgets.QLabel(description)
+            label.setWordWrap(True)
+            label.setFont(desc_font)
+            v.addWidget(label)
             return container
 
         # Sample rate
-        default_sr = int(settings.value("sample_rate", constants.SAMPLE_RATE))
+        default_sr = cfg["sample_rate"]
         self.sample_rate_spin = QtWidgets.QSpinBox()
         self.sample_rate_spin.setRange(8000, 96000)
         self.sample_rate_spin.setSingleStep(1000)
@@ -1489,7 +2214,7 @@ class SettingsDialog(QtWidgets.QDialog):
         )
 
         # Buffer size
-        default_buf = int(settings.value("buffer_size", constants.BUFFER_SIZE))
+        default_buf = cfg["buffer_size"]
         self.buffer_size_spin = QtWidgets.QSpinBox()
         self.buffer_size_spin.setRange(256, 8192)
         self.buffer_size_spin.setSingleStep(256)
@@ -1503,9 +2228,7 @@ class SettingsDialog(QtWidgets.QDialog):
         )
 
         # Noise gate margin
-        default_gate_margin = float(
-            settings.value("noise_gate_margin", constants.NOISE_GATE_MARGIN)
-        )
+        default_gate_margin = cfg["noise_gate_margin"]
         self.gate_margin_spin = QtWidgets.QDoubleSpinBox()
         self.gate_margin_spin.setRange(1.0, 5.0)
         self.gate_margin_spin.setSingleStep(0.1)
@@ -1520,11 +2243,10 @@ class SettingsDialog(QtWidgets.QDialog):
         )
 
         # Detection method
-        default_method = str(settings.value("detection_method", constants.MATCH_METHOD))
+        default_method = cfg["detection_method"]
         self.method_combo = QtWidgets.QComboBox()
-        self.method_combo.addItems(["waveform", "mfcc", "dtw"])
-        if default_method in ("waveform", "mfcc", "dtw"):
-            self.method_combo.setCurrentText(default_method)
+        self.method_combo.addItems(_METHODS)
+        self.method_combo.setCurrentIndex(_METHOD_INDEX.get(default_method, 0))
         form.addRow(
             "Matching algorithm",
             make_field(
@@ -1534,9 +2256,7 @@ class SettingsDialog(QtWidgets.QDialog):
         )
 
         # Match threshold
-        default_match = float(
-            settings.value("match_threshold", constants.MATCH_THRESHOLD)
-        )
+        default_match = cfg["match_threshold"]
         self.match_thresh_spin = QtWidgets.QDoubleSpinBox()
         self.match_thresh_spin.setRange(0.0, 1.0)
         self.match_thresh_spin.setSingleStep(0.05)
@@ -1551,9 +2271,7 @@ class SettingsDialog(QtWidgets.QDialog):
         )
 
         # High-pass filter cutoff
-        default_hp_cutoff = float(
-            settings.value("hp_cutoff", constants.HP_FILTER_CUTOFF)
-        )
+        default_hp_cutoff = cfg["hp_cutoff"]
         self.hp_cutoff_spin = QtWidgets.QDoubleSpinBox()
         self.hp_cutoff_spin.setRange(20.0, 1000.0)
         self.hp_cutoff_spin.setSingleStep(10.0)
@@ -1567,9 +2285,11 @@ class SettingsDialog(QtWidgets.QDialog):
             ),
         )
 
-        cal_btn = QtWidgets.QPushButton("Calibrate Noise Floor")
-        cal_btn.clicked.connect(self._calibrate_noise_floor)
-        layout.addWidget(cal_btn)
+        self.cal_btn = QtWidgets.QPushButton("Calibrate Noise Floor")
+        self.cal_btn.clicked.connect(self._calibrate_noise_floor)
+        layout.addWidget(self.cal_btn)
+        self._cal_thread: Optional[CalibrationThread] = None
+        self._cal_progress: Optional[QtWidgets.QProgressDialog] = None
 
         self.buttons = QtWidgets.QDialogButtonBox(
             QtWidgets.QDialogButtonBox.Ok | QtWidgets.QDialogButtonBox.Cancel,
@@ -1580,20 +2300,59 @@ class SettingsDialog(QtWidgets.QDialog):
         self.buttons.rejected.connect(self.reject)
         layout.addWidget(self.buttons)
 
+        # Values currently stored in QSettings; ``accept`` only writes keys
+        # that differ from these.  The main window keeps this dialogue for
+        # reuse and it is the only writer of these keys, so they stay valid
+        # across opens without re-reading QSettings.
+        self._loaded = {
+            "sample_rate": default_sr,
+            "buffer_size": default_buf,
+            "noise_gate_margin": default_gate_margin,
+            "detection_method": default_method,
+            "match_threshold": default_match,
+            "hp_cutoff": default_hp_cutoff,
+        }
+
         self.setMinimumWidth(500)
 
     def accept(self) -> None:
         settings = self.parent_window.settings
-        settings.setValue("sample_rate", self.sample_rate_spin.value())
-        settings.setValue("buffer_size", self.buffer_size_spin.value())
-        settings.setValue("noise_gate_margin", self.gate_margin_spin.value())
-        settings.setValue("detection_method", self.method_combo.currentText())
-        settings.setValue("match_threshold", self.match_thresh_spin.value())
-        settings.setValue("hp_cutoff", self.hp_cutoff_spin.value())
+        values = {
+            "sample_rate": self.sample_rate_spin.value(),
+            "buffer_size": self.buffer_size_spin.value(),
+            "noise_gate_margin": self.gate_margin_spin.value(),
+            "detection_method": self.method_combo.currentText(),
+            "match_threshold": self.match_thresh_spin.value(),
+            "hp_cutoff": self.hp_cutoff_spin.value(),
+        }
+        changed = {k: v for k, v in values.items() if self._loaded.get(k) != v}
+        for key, value in changed.items():
+            settings.setValue(key, value)
+        self.parent_window._audio_config().update(changed)
+        if changed:
+            # One flush for the whole batch instead of leaving it to
+            # QSettings' own sync timer.
+            settings.sync()
+        self._loaded = values
         super().accept()
 
+    def _show_values(self, values: dict[str, Any]) -> None:
+        """Put ``values`` back into the editors."""
+        self.sample_rate_spin.setValue(values["sample_rate"])
+        self.buffer_size_spin.setValue(values["buffer_size"])
+        self.gate_margin_spin.setValue(values["noise_gate_margin"])
+        self.method_combo.setCurrentIndex(
+            _METHOD_INDEX.get(values["detection_method"], 0)
+        )
+        self.match_thresh_spin.setValue(values["match_threshold"])
+        self.hp_cutoff_spin.setValue(values["hp_cutoff"])
+
     def _calibrate_noise_floor(self) -> None:
-        """Measure ambient noise and store it for the selected device."""
+        """Start measuring ambient noise for the selected device.
+
+        Recording runs on a :class:`CalibrationThread` so the dialogue stays
+        responsive; the result is stored by :meth:`_on_calibrated`.
+        """
         idx = self.parent_window.current_device_index()
 
         if idx is None:
@@ -1606,28 +2365,59 @@ class SettingsDialog(QtWidgets.QDialog):
                 "The sounddevice module could not be loaded.",
             )
             return
-        try:
-            sample_rate = int(self.sample_rate_spin.value())
-            duration = 2.0
-            total = int(sample_rate * duration)
-            blocks: list[np.ndarray] = []
-            with sd.InputStream(
-                device=int(idx),
-                channels=1,
-                samplerate=sample_rate,
-                blocksize=constants.HOP_SIZE,
-                dtype="float32",
-            ) as stream:
-                while sum(b.size for b in blocks) < total:
-                    data, _ = stream.read(constants.HOP_SIZE)
-                    blocks.append(data.reshape(-1))
-            samples = np.concatenate(blocks)[:total]
-            floor = calculate_noise_floor(samples)
-            self.parent_window.settings.setValue(f"noise_floor_{idx}", floor)
-            QtWidgets.QMessageBox.information(
-                self,
-                "Calibration complete",
-                "Noise floor stored.",
-            )
-        except Exception as e:
-            QtWidgets.QMessageBox.warning(self, "Calibration failed", str(e))
+
+        self.cal_btn.setEnabled(False)
+        self._cal_device = int(idx)
+        sample_rate = int(self.sample_rate_spin.value())
+        self._cal_thread = CalibrationThread(
+            self._cal_device,
+            sample_rate,
+            highpass_sos(self.hp_cutoff_spin.value(), sample_rate),
+        )
+        self._cal_thread.calibrated.connect(self._on_calibrated)
+        self._cal_thread.failed.connect(self._on_calibration_failed)
+        self._cal_thread.finished.connect(self._on_calibration_finished)
+
+        self._cal_progress = QtWidgets.QProgressDialog(
+            "Measuring ambient noise…", "Cancel", 0, 100, self
+        )
+        self._cal_progress.setWindowTitle("Calibrating")
+        self._cal_progress.setWindowModality(QtCore.Qt.WindowModal)
+        self._cal_progress.setMinimumDuration(0)
+        self._cal_progress.setAutoReset(False)
+        self._cal_progress.canceled.connect(self._cal_thread.stop)
+        self._cal_thread.progress.connect(self._cal_progress.setValue)
+        self._cal_progress.show()
+
+        self._cal_thread.start()
+
+    def _on_calibrated(self, floor: float) -> None:
+        """Persist the measured noise floor for the calibrated device."""
+        self.parent_window.settings.setValue(f"noise_floor_{self._cal_device}", floor)
+        self._cal_progress.reset()
+        QtWidgets.QMessageBox.information(
+            self,
+            "Calibration complete",
+            "Noise floor stored.",
+        )
+
+    def _on_calibration_failed(self, message: str) -> None:
+        self._cal_progress.reset()
+        QtWidgets.QMessageBox.warning(self, "Calibration failed", message)
+
+    def _on_calibration_finished(self) -> None:
+        """Restore the dialog once the calibration thread has exited."""
+        # A new progress dialog is made per run; release this one
+        self._cal_progress.reset()
+        self._cal_progress.deleteLater()
+        self._cal_progress = None
+        self._cal_thread = None
+        self.cal_btn.setEnabled(True)
+
+    def reject(self) -> None:  # noqa: D401 - close dialogue
+        if self._cal_thread and self._cal_thread.isRunning():
+            self._cal_thread.stop()
+            self._cal_thread.wait()
+        # Discard edits so the next open shows the stored values.
+        self._show_values(self._loaded)
+        super().reject()
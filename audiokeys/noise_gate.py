@@ -92,6 +92,41 @@ class AdaptiveNoiseGate:
         return rms < (self.noise_floor * self.margin)
 
 
+def _block_bounds(size: int, hop_size: int) -> np.ndarray:
+    """Return the start index of each analysis block of a ``size`` signal.
+
+    Blocks match :func:`numpy.array_split` into ``size // hop_size`` parts:
+    the first ``size % n`` blocks are one sample longer than the rest.
+    """
+
+    n = max(1, size // hop_size)
+    idx = np.arange(n)
+    return idx * (size // n) + np.minimum(idx, size % n)
+
+
+def _block_rms(samples: np.ndarray, starts: np.ndarray) -> np.ndarray:
+    """Return the RMS of each block of ``samples`` beginning at ``starts``.
+
+    ``starts`` must come from :func:`_block_bounds`, so the longer and the
+    shorter blocks each form a regular 2-D view.  ``einsum`` sums the
+    squares of each row without materialising a squared copy of the input.
+    """
+
+    size, n = samples.size, starts.size
+    q, r = divmod(size, n)
+    split = r * (q + 1)
+    head = samples[:split].reshape(r, q + 1)
+    tail = samples[split:].reshape(n - r, q)
+    sums = np.concatenate(
+        (
+            np.einsum("ij,ij->i", head, head, dtype=np.float64),
+            np.einsum("ij,ij->i", tail, tail, dtype=np.float64),
+        )
+    )
+    lengths = np.diff(starts, append=size)
+    return np.sqrt(sums / lengths)
+
+
 def calculate_noise_floor(samples: np.ndarray, hop_size: int = HOP_SIZE) -> float:
     """Estimate the ambient noise floor for ``samples``.
 
@@ -117,9 +152,8 @@ def calculate_noise_floor(samples: np.ndarray, hop_size: int = HOP_SIZE) -> floa
     if samples.size == 0:
         return 0.0
 
-    blocks = np.array_split(samples, max(1, samples.size // hop_size))
-    rms_vals = [float(np.sqrt(np.mean(b**2))) for b in blocks if b.size]
-    return float(np.median(rms_vals)) if rms_vals else 0.0
+    rms_vals = _block_rms(samples, _block_bounds(samples.size, hop_size))
+    return float(np.median(rms_vals))
 
 
 def trim_silence(
@@ -156,22 +190,20 @@ def trim_silence(
     if samples.size == 0:
         return samples
 
-    floor = calculate_noise_floor(samples, hop_size=hop_size)
-    threshold = floor * margin
+    # One pass computes the block levels used for both the floor estimate
+    # and the trim points.
+    starts = _block_bounds(samples.size, hop_size)
+    rms_vals = _block_rms(samples, starts)
+    threshold = float(np.median(rms_vals)) * margin
     if threshold <= 0.0:
         return samples
 
-    blocks = np.array_split(samples, max(1, samples.size // hop_size))
-    rms_vals = [float(np.sqrt(np.mean(b**2))) for b in blocks]
-    active = [i for i, rms in enumerate(rms_vals) if rms >= threshold]
-    if not active:
+    active = np.flatnonzero(rms_vals >= threshold)
+    if not active.size:
         return np.array([], dtype=samples.dtype)
 
-    start_block = active[0]
-    end_block = active[-1] + 1
-    start_idx = start_block * hop_size
-    end_idx = min(end_block * hop_size, samples.size)
-    return samples[start_idx:end_idx]
+    bounds = np.append(starts, samples.size)
+    return samples[bounds[active[0]] : bounds[active[-1] + 1]]
 
 
 __all__ = ["AdaptiveNoiseGate", "calculate_noise_floor", "trim_silence"]
@@ -0,0 +1,83 @@
+"""On-disk storage for recorded reference samples.
+
+Each mapping's samples are packed into one compressed ``.npz`` archive
+holding 16-bit PCM, the offsets needed to split the takes apart again,
+the sample rate and a layout version.  Older releases wrote one ``.npy``
+file per sample; :func:`load_sample_file` still reads those.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+
+from .constants import SAMPLE_RATE
+from .noise_gate import trim_silence
+
+# Layout version of the packed ``.npz`` cache.  Bump when the stored arrays
+# change meaning so stale caches are rejected on load.
+SAMPLE_CACHE_VERSION: int = 1
+
+# Full-scale value used to store samples as 16-bit PCM.
+PCM16_SCALE: float = 32767.0
+
+
+def write_sample_cache(path: Path, samples: list[np.ndarray]) -> None:
+    """Pack ``samples`` into the ``.npz`` cache at ``path``.
+
+    Samples are rounded to the nearest PCM step and values outside
+    ``[-1, 1]`` saturate at full scale rather than wrapping.  The archive is
+    written to a temporary file and moved into place, so readers never see
+    a partial cache; the temporary file is removed if the write fails.
+    """
+
+    path = Path(path)
+    tmp = path.with_name(path.name + ".tmp")
+    pcm = np.rint(np.concatenate(samples) * PCM16_SCALE)
+    try:
+        with open(tmp, "wb") as fh:
+            np.savez_compressed(
+                fh,
+                data=np.clip(pcm, -PCM16_SCALE, PCM16_SCALE).astype(np.int16),
+                offsets=np.cumsum([s.size for s in samples[:-1]], dtype=np.int64),
+                sr=SAMPLE_RATE,
+                version=SAMPLE_CACHE_VERSION,
+            )
+        tmp.replace(path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+def read_sample_cache(path: Path) -> list[np.ndarray]:
+    """Return the samples packed in ``path`` by :func:`write_sample_cache`.
+
+    Raises ``ValueError`` if the cache was written with a different layout
+    version or sample rate.
+    """
+
+    with np.load(path) as cache:
+        version = int(cache["version"])
+        sr = int(cache["sr"])
+        if version != SAMPLE_CACHE_VERSION or sr != SAMPLE_RATE:
+            raise ValueError(f"stale sample cache (version {version}, {sr} Hz)")
+        data = cache["data"]
+        if data.dtype == np.int16:
+            data = data.astype(np.float32) * np.float32(1.0 / PCM16_SCALE)
+        return np.split(data, cache["offsets"])
+
+
+def load_sample_file(path: Path) -> list[np.ndarray]:
+    """Return the samples stored in ``path``.
+
+    ``.npz`` files are read with :func:`read_sample_cache`.  Anything else
+    is a legacy one-sample ``.npy`` file, which is memory-mapped rather than
+    read: ``trim_silence`` returns a slice, so only the pages the matcher
+    actually touches get paged in.
+    """
+
+    path = Path(path)
+    if path.suffix == ".npz":
+        return read_sample_cache(path)
+    return [trim_silence(np.load(path, mmap_mode="r"))]
@@ -163,10 +163,13 @@ def record_until_silence(
     """
     import sounddevice as sd
 
-    frames: list[np.ndarray] = []
     silent = 0
     required = int(silence_duration * sample_rate)
     limit = int(max_duration * sample_rate)
+    # Blocks are downmixed straight into one buffer sized for the longest
+    # allowed take, so no per-block arrays are kept or concatenated.
+    buf = np.empty(limit, dtype=np.float32)
+    acquired = 0
     with sd.InputStream(
         device=device_index,
         channels=channels,
@@ -174,25 +177,25 @@ def record_until_silence(
         blocksize=hop_size,
         dtype="float32",
     ) as stream:
-        while sum(len(x) for x in frames) < limit:
+        while acquired < limit:
             if stop_event and stop_event.is_set():
                 break
             data, _ = stream.read(hop_size)
+            n = min(len(data), limit - acquired)
+            block = buf[acquired : acquired + n]
             if data.ndim == 2 and data.shape[1] > 1:
-                block = data.mean(axis=1)
+                np.mean(data[:n], axis=1, dtype=np.float32, out=block)
             else:
-                block = data.reshape(-1)
-            frames.append(block)
+                block[:] = data[:n, 0]
+            acquired += n
             rms = float(np.sqrt(np.mean(block**2)))
             if rms < threshold:
                 silent += hop_size
-                if silent >= required and sum(len(x) for x in frames) > hop_size:
+                if silent >= required and acquired > hop_size:
                     break
             else:
                 silent = 0
-    if frames:
-        return np.concatenate(frames)
-    return np.array([], dtype=np.float32)
+    return buf[:acquired].copy()
 
 
 __all__ = ["cosine_similarity", "match_sample", "record_until_silence"]
@@ -5,6 +5,8 @@ from __future__ import annotations
 import gc
 import threading
 from collections import deque
+from dataclasses import dataclass, replace
+from functools import lru_cache
 from typing import Mapping, MutableMapping, Optional, Sequence
 import time
 
@@ -20,6 +22,7 @@ from .constants import (
     HP_FILTER_CUTOFF,
     NOISE_GATE_CALIBRATION_TIME,
     NOISE_GATE_MARGIN,
+    MATCH_METHOD,
     MATCH_THRESHOLD,
     SAMPLE_RATE,
 )
@@ -27,12 +30,51 @@ from .sample_matcher import DetectionMethod, match_sample
 from .noise_gate import AdaptiveNoiseGate
 
 
+@dataclass(frozen=True)
+class AudioConfig:
+    """Detection settings that may change while a worker is running.
+
+    Instances are immutable; :meth:`SoundWorker.set_config` publishes a new
+    one by swapping a single reference, so readers never observe a
+    half-updated configuration and no lock is needed.  Parameters that
+    shape the audio stream itself (sample rate, buffer and hop size,
+    high-pass cutoff) still require a new worker.
+    """
+
+    match_threshold: float = MATCH_THRESHOLD
+    match_method: DetectionMethod = MATCH_METHOD
+    noise_gate_margin: float = NOISE_GATE_MARGIN
+    send_enabled: bool = True
+    min_press_interval: float = 0.25
+
+
+def highpass_sos(cutoff: float, sample_rate: int) -> np.ndarray:
+    """Design the worker's high-pass filter as second-order sections.
+
+    Designs are memoised per ``(cutoff, sample_rate)`` and shared between
+    callers, so the returned array must not be modified.  (It cannot be
+    flagged read-only: :func:`scipy.signal.sosfilt` needs a writable buffer.)
+
+    Args:
+        cutoff: Cutoff frequency in Hertz.
+        sample_rate: Sampling frequency of the audio stream.
+
+    Returns:
+        Filter coefficients suitable for :func:`scipy.signal.sosfilt`.
+    """
+    return _design_highpass(float(cutoff), int(sample_rate))
+
+
+@lru_cache(maxsize=32)
+def _design_highpass(cutoff: float, sample_rate: int) -> np.ndarray:
+    return butter(2, cutoff, "hp", fs=sample_rate, output="sos")
+
+
 class SoundWorker(QtCore.QThread):
     """Capture audio and match blocks against stored samples."""
 
     # Emit detected key and similarity score
     keyDetected = QtCore.Signal(str, float)
-    amplitudeChanged = QtCore.Signal(float)
 
     def __init__(
         self,
@@ -50,7 +92,7 @@ class SoundWorker(QtCore.QThread):
         noise_gate_margin: float = NOISE_GATE_MARGIN,
         preset_noise_floor: Optional[float] = None,
         match_threshold: float = MATCH_THRESHOLD,
-        match_method: DetectionMethod = "waveform",
+        match_method: DetectionMethod = MATCH_METHOD,
         send_enabled: bool = True,
         min_press_interval: float = 0.25,
     ) -> None:
@@ -82,10 +124,18 @@ class SoundWorker(QtCore.QThread):
         self.sample_rate = sample_rate
         self.buffer_size = buffer_size
         self.hop_size = hop_size
-        self.match_threshold = match_threshold
-        self.match_method = match_method
-        self.min_press_interval = min_press_interval
+        self._cfg_atomic = AudioConfig(
+            match_threshold=match_threshold,
+            match_method=match_method,
+            noise_gate_margin=noise_gate_margin,
+            send_enabled=send_enabled,
+            min_press_interval=min_press_interval,
+        )
         self._last_emit = 0.0
+        # Most recent block RMS.  Written only by the audio callback and
+        # polled by the GUI level meter; a float assignment is atomic under
+        # the GIL so no lock or cross-thread signal is required.
+        self.latest_amplitude: float = 0.0
         self._stop_event = threading.Event()
         self.stream: Optional[sd.InputStream] = None
         self.buffer: deque[np.ndarray] = deque()
@@ -101,23 +151,26 @@ class SoundWorker(QtCore.QThread):
             preset_noise_floor=preset_noise_floor,
         )
         self.sender = KeySender(self.note_map, send_enabled=send_enabled)
-        self.hp_sos = butter(2, hp_cutoff, "hp", fs=sample_rate, output="sos")
+        self.hp_sos = highpass_sos(hp_cutoff, sample_rate)
         self.hp_zi = sosfilt_zi(self.hp_sos)
 
     # --------------------------------------------------------------
     def _process_segment(self, segment: np.ndarray) -> None:
         """Match a captured ``segment`` against reference samples."""
 
+        # Snapshot the configuration once so a concurrent ``set_config``
+        # cannot mix old and new values within one segment.
+        cfg = self._cfg_atomic
         key, score = match_sample(
             segment,
             self.samples,
-            threshold=self.match_threshold,
-            method=self.match_method,
+            threshold=cfg.match_threshold,
+            method=cfg.match_method,
             sample_rate=self.sample_rate,
         )
         if key is not None:
             now = time.time()
-            if now - self._last_emit >= self.min_press_interval:
+            if now - self._last_emit >= cfg.min_press_interval:
                 self.sender.press(key)
                 self.keyDetected.emit(key, score)
                 self.sender.release(key)
@@ -128,14 +181,18 @@ class SoundWorker(QtCore.QThread):
         if status:
             print(f"⚠️  {status}")
         try:
+            # Mono input is filtered straight from a column view of
+            # ``indata``; ``sosfilt`` returns a new array, so nothing keeps
+            # a reference to PortAudio's buffer after the callback returns.
             if indata.ndim == 2 and indata.shape[1] > 1:
-                samples = indata.mean(axis=1).astype(np.float32)
+                samples = indata.mean(axis=1, dtype=np.float32)
+            elif indata.ndim == 2:
+                samples = indata[:, 0]
             else:
-                samples = indata.reshape(-1).astype(np.float32)
+                samples = indata
 
             samples, self.hp_zi = sosfilt(self.hp_sos, samples, zi=self.hp_zi)
-            current_rms = self.noise_gate.update(samples)
-            self.amplitudeChanged.emit(current_rms)
+            self.latest_amplitude = self.noise_gate.update(samples)
 
             if self.noise_gate.noise_floor is None:
                 return
@@ -189,9 +246,31 @@ class SoundWorker(QtCore.QThread):
         gc.collect()
         self.wait(2000)
 
-    def set_send_enabled(self, enabled: bool) -> None:
+    def set_config(self, config: AudioConfig) -> None:
+        """Publish ``config`` to the running worker without restarting it."""
+        self._cfg_atomic = config
+        self.noise_gate.margin = config.noise_gate_margin
         if hasattr(self, "sender"):
-            self.sender.set_send_enabled(enabled)
+            self.sender.set_send_enabled(config.send_enabled)
+
+    @property
+    def match_threshold(self) -> float:
+        return self._cfg_atomic.match_threshold
+
+    @match_threshold.setter
+    def match_threshold(self, value: float) -> None:
+        self.set_config(replace(self._cfg_atomic, match_threshold=value))
+
+    @property
+    def match_method(self) -> DetectionMethod:
+        return self._cfg_atomic.match_method
+
+    @match_method.setter
+    def match_method(self, value: DetectionMethod) -> None:
+        self.set_config(replace(self._cfg_atomic, match_method=value))
+
+    def set_send_enabled(self, enabled: bool) -> None:
+        self.set_config(replace(self._cfg_atomic, send_enabled=enabled))
 
 
-__all__ = ["SoundWorker"]
+__all__ = ["AudioConfig", "SoundWorker", "highpass_sos"]
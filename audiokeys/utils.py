@@ -4,6 +4,7 @@ import subprocess
 import sys
 import tempfile
 from collections.abc import Iterable
+from functools import lru_cache
 
 from PySide6 import QtCore, QtWidgets, QtGui
 from pathlib import Path
@@ -55,6 +56,9 @@ chmod 666 /dev/uinput 2>/dev/null || true
     )
 
 
+# Asset locations are fixed for the life of the process; memoising avoids
+# repeating the ``_MEIPASS`` existence checks for every icon lookup.
+@lru_cache(maxsize=None)
 def resource_path(relative_path: str) -> str:
     if getattr(sys, "frozen", False):
         base = getattr(sys, "_MEIPASS")
@@ -82,7 +86,7 @@ def generate_sample_id(base: str, existing: Iterable[str]) -> str:
     """
 
     # Ensure the base is safe for filenames by stripping whitespace and
-    # replacing internal spaces with underscores.  This keeps saved ``.npy``
+    # replacing internal spaces with underscores.  This keeps saved sample
     # files consistent across platforms.
     safe_base = base.strip().replace(" ", "_") or "sample"
     index = 1
@@ -94,10 +98,21 @@ def generate_sample_id(base: str, existing: Iterable[str]) -> str:
     return candidate
 
 
+# One shared ``QIcon`` per SVG file; mapping rows reuse the same few icons,
+# so each file is parsed and rasterised once rather than once per button.
+_ICON_CACHE: dict[str, QtGui.QIcon] = {}
+
+
+def _svg_icon(svg_path: str) -> QtGui.QIcon:
+    icon = _ICON_CACHE.get(svg_path)
+    if icon is None:
+        icon = _ICON_CACHE[svg_path] = QtGui.QIcon(str(Path(svg_path)))
+    return icon
+
+
 def make_svg_toolbutton(svg_path: str, tooltip: str, slot) -> QtWidgets.QToolButton:
     btn = QtWidgets.QToolButton()
-    icon = QtGui.QIcon(str(Path(svg_path)))
-    btn.setIcon(icon)
+    btn.setIcon(_svg_icon(svg_path))
     btn.setIconSize(QtCore.QSize(16, 16))  # adjust as needed
     btn.setAutoRaise(True)
     btn.setToolTip(tooltip)
@@ -26,3 +26,23 @@ def test_trim_silence_removes_leading_and_trailing_noise() -> None:
     trimmed = trim_silence(samples, hop_size=50, margin=1.2)
     assert trimmed.size < samples.size
     assert trimmed.size == pytest.approx(tone.size, rel=0.2)
+
+
+def test_calculate_noise_floor_matches_ragged_blocks() -> None:
+    rng = np.random.default_rng(7)
+    noise = rng.normal(scale=0.02, size=1234)
+    blocks = np.array_split(noise, noise.size // 100)
+    expected = np.median([np.sqrt(np.mean(b**2)) for b in blocks])
+    assert np.isclose(calculate_noise_floor(noise, hop_size=100), expected)
+
+
+def test_trim_silence_exact_bounds_for_ragged_blocks() -> None:
+    rng = np.random.default_rng(11)
+    samples = rng.normal(scale=0.001, size=1234)
+    # 12 blocks: ten of 103 then two of 102; the tone spans the boundary
+    blocks = np.array_split(np.arange(samples.size), samples.size // 100)
+    start, end = blocks[8][0], blocks[10][-1] + 1
+    samples[start:end] = np.sin(np.linspace(0, 6 * np.pi, end - start))
+    trimmed = trim_silence(samples, hop_size=100, margin=1.5)
+    assert (start, end) == (824, 1132)
+    np.testing.assert_array_equal(trimmed, samples[start:end])
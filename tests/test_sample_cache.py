@@ -0,0 +1,81 @@
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from audiokeys.constants import HOP_SIZE, SAMPLE_RATE
+from audiokeys.sample_cache import (
+    PCM16_SCALE,
+    SAMPLE_CACHE_VERSION,
+    load_sample_file,
+    read_sample_cache,
+    write_sample_cache,
+)
+
+
+def test_sample_cache_round_trips_takes_of_different_lengths(tmp_path: Path) -> None:
+    rng = np.random.default_rng(1)
+    takes = [
+        rng.uniform(-0.9, 0.9, size=n).astype(np.float32) for n in (300, 1, 1024)
+    ]
+    path = tmp_path / "tap.npz"
+    write_sample_cache(path, takes)
+
+    loaded = read_sample_cache(path)
+    assert [t.size for t in loaded] == [t.size for t in takes]
+    for got, want in zip(loaded, takes):
+        assert got.dtype == np.float32
+        np.testing.assert_allclose(got, want, atol=0.5 / PCM16_SCALE)
+    assert not (tmp_path / "tap.npz.tmp").exists()
+
+
+def test_sample_cache_records_and_checks_version(tmp_path: Path) -> None:
+    path = tmp_path / "tap.npz"
+    write_sample_cache(path, [np.zeros(10, dtype=np.float32)])
+    with np.load(path) as cache:
+        assert int(cache["version"]) == SAMPLE_CACHE_VERSION
+        assert int(cache["sr"]) == SAMPLE_RATE
+
+    stale = tmp_path / "stale.npz"
+    np.savez_compressed(
+        stale,
+        data=np.zeros(10, dtype=np.int16),
+        offsets=np.empty(0, dtype=np.int64),
+        sr=SAMPLE_RATE,
+        version=SAMPLE_CACHE_VERSION + 1,
+    )
+    with pytest.raises(ValueError):
+        read_sample_cache(stale)
+
+
+def test_load_sample_file_reads_legacy_npy_directory(tmp_path: Path) -> None:
+    rng = np.random.default_rng(2)
+    tones = []
+    # Block-aligned with ``HOP_SIZE`` so the trim lands exactly on the tone
+    for i, n in enumerate((HOP_SIZE * 2, HOP_SIZE * 3)):
+        tone = np.sin(np.linspace(0, 8 * np.pi, n)).astype(np.float32)
+        quiet = rng.normal(scale=0.001, size=(2, HOP_SIZE * 4)).astype(np.float32)
+        np.save(tmp_path / f"tap_{i}.npy", np.concatenate([quiet[0], tone, quiet[1]]))
+        tones.append(tone)
+
+    for path, tone in zip(sorted(tmp_path.glob("*.npy")), tones):
+        (loaded,) = load_sample_file(path)
+        np.testing.assert_array_equal(loaded, tone)
+
+
+def test_sample_cache_saturates_out_of_range_values(tmp_path: Path) -> None:
+    take = np.array([-3.0, -1.0, -0.5, 0.0, 0.5, 1.0, 1.5], dtype=np.float32)
+    path = tmp_path / "loud.npz"
+    write_sample_cache(path, [take])
+
+    with np.load(path) as cache:
+        np.testing.assert_array_equal(
+            cache["data"], [-32767, -32767, -16384, 0, 16384, 32767, 32767]
+        )
+    (loaded,) = read_sample_cache(path)
+    np.testing.assert_allclose(
+        loaded, np.clip(take, -1.0, 1.0), atol=0.5 / PCM16_SCALE
+    )
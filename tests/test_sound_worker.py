@@ -83,3 +83,11 @@ def test_match_threshold_respected(monkeypatch: pytest.MonkeyPatch) -> None:
     worker.match_threshold = 1.1
     worker._process_segment(sample)
     assert worker.sender.pressed == ["x"]
+
+
+def test_highpass_sos_is_shared_per_design() -> None:
+    """Repeated designs are served from the cache."""
+
+    sos = sound_worker.highpass_sos(100.0, 44_100)
+    assert sound_worker.highpass_sos(100, 44_100.0) is sos
+    assert sound_worker.highpass_sos(120.0, 44_100) is not sos